@@ -0,0 +1,117 @@
+"""
+Evaluate a batch of .sus project files without opening the GUI.
+
+    python batch_runner.py setups/ -o summary.csv
+    python batch_runner.py "setups/**/*.sus" -o summary.json
+
+Every corner of every project gets one row with its ride height, rebound and
+heave travel, the bind margins of both springs and the first pair of parts to
+interfere along the travel. Projects are evaluated on a
+process pool, one worker per core by default.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import clearance
+from coilover_model import CORNERS, CoiloverModel
+
+SUMMARY_FIELDS = (
+    "file",
+    "corner",
+    "corner_load",
+    "ride_height_position",
+    "force",
+    "rebound_travel",
+    "heave_travel",
+    "spring_bind_margin",
+    "helper_bind_margin",
+    "interference_parts",
+    "interference_travel",
+    "error",
+)
+
+def find_projects(patterns):
+    """
+    Expand directories and glob patterns into a sorted list of .sus files.
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = glob.glob(os.path.join(pattern, "**", "*.sus"), recursive=True)
+        else:
+            matches = glob.glob(pattern, recursive=True)
+        paths.extend(path for path in matches if os.path.isfile(path))
+    return sorted(set(paths))
+
+def evaluate_project(path):
+    """
+    Summary rows for every corner of one project file. A file that can't be
+    read or has invalid inputs gives a single row with the error message.
+    """
+    try:
+        model = CoiloverModel.from_file(path)
+        interference = clearance.first_interference(clearance.compute_clearances(model))
+        parts, travel = ("/".join(interference[0]), interference[1]) if interference else (None, None)
+        return [
+            {"file": path, **model.compute_corner_summary(corner), "interference_parts": parts, "interference_travel": travel}
+            for corner in CORNERS
+        ]
+    except (OSError, ValueError) as e:
+        return [{"file": path, "error": str(e)}]
+
+def run_batch(paths, workers=None):
+    """
+    Evaluate project files on a process pool and return the summary rows in
+    the order of paths. workers=1 evaluates in this process.
+    """
+    if workers == 1 or len(paths) <= 1:
+        results = map(evaluate_project, paths)
+        return [row for rows in results for row in rows]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(evaluate_project, paths, chunksize=chunksize)
+        return [row for rows in results for row in rows]
+
+def write_summary(rows, out):
+    """
+    Write summary rows as JSON when out ends in .json, otherwise as CSV.
+    out may be a path or an open text file.
+    """
+    if isinstance(out, str):
+        with open(out, "w", newline="", encoding="utf-8") as f:
+            if out.lower().endswith(".json"):
+                json.dump(rows, f, indent=2)
+            else:
+                write_summary(rows, f)
+        return
+
+    writer = csv.DictWriter(out, fieldnames=SUMMARY_FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate ride height and travel for .sus project files.")
+    parser.add_argument("paths", nargs="+", help="project files, directories or glob patterns")
+    parser.add_argument("-o", "--output", default="-", help="summary file (.csv or .json), default: CSV on stdout")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: one per core)")
+    args = parser.parse_args(argv)
+
+    paths = find_projects(args.paths)
+    if not paths:
+        parser.error("no .sus files found")
+
+    rows = run_batch(paths, args.workers)
+    write_summary(rows, sys.stdout if args.output == "-" else args.output)
+
+    # non-zero exit when any project failed to evaluate
+    return 1 if any(row.get("error") for row in rows) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Time make_spring_wire against the original per-point loop sweep.
+
+    python benchmarks/bench_spring_wire.py
+    python benchmarks/bench_spring_wire.py --points 150 1000 5000 --sides 8 16
+
+The loop sweep is the implementation make_spring_wire replaced, kept here
+as the reference. Before timing, each resolution checks that the vectorized
+sweep places the same vertexes and faces as the loop when both use the
+same frames. Times are the best of --repeat runs, so make_spring_wire
+reuses its cached face topology like it does in the app.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mesh_utils  # noqa: E402
+from physics_utils import _projected_frames, compute_tangents  # noqa: E402
+
+def loop_spring_wire(path_pts, wire_radius, n_sides=8):
+    """
+    The original sweep: frames from the projection loop, then vertexes and
+    faces appended point by point.
+    """
+    tangents = compute_tangents(path_pts)
+    normals, binorms = _projected_frames(path_pts, tangents)
+
+    theta = np.linspace(0, 2*np.pi, n_sides, endpoint=False)
+    circle = np.vstack([np.cos(theta), np.sin(theta)]) * wire_radius
+
+    verts = []
+    faces = []
+    for i, p in enumerate(path_pts):
+        for j in range(n_sides):
+            verts.append(p + normals[i]*circle[0,j] + binorms[i]*circle[1,j])
+    verts = np.array(verts)
+
+    for i in range(len(path_pts) - 1):
+        for j in range(n_sides):
+            a = i*n_sides + j
+            b = i*n_sides + (j+1)%n_sides
+            c = (i+1)*n_sides + j
+            d = (i+1)*n_sides + (j+1)%n_sides
+            faces.append([a, c, b])
+            faces.append([b, c, d])
+    return verts, np.array(faces)
+
+def helix(n_points, coils=6.5, radius=36.55, length=92.0):
+    theta = np.linspace(0, 2*np.pi*coils, n_points)
+    return np.column_stack([radius*np.cos(theta), radius*np.sin(theta), np.linspace(0, length, n_points)])
+
+def best_time(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def check_agreement(path, wire_radius, n_sides):
+    verts, faces = loop_spring_wire(path, wire_radius, n_sides)
+    tangents = compute_tangents(path)
+    normals, binorms = _projected_frames(path, tangents)
+    swept, _ = mesh_utils._sweep(path, normals, binorms, mesh_utils._circle_profile(wire_radius, n_sides))
+    assert np.allclose(swept, verts, atol=1e-4), "vertexes differ"
+    assert np.array_equal(mesh_utils._sweep_faces(len(path), n_sides), faces), "faces differ"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--points", type=int, nargs="+", default=[150, 500, 2000, 5000])
+    parser.add_argument("--sides", type=int, nargs="+", default=[8, 16])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    wire_radius = 4.8
+    print(f"{'points':>7} {'sides':>5} {'loop ms':>9} {'new ms':>8} {'speedup':>8}")
+    for n_points in args.points:
+        path = helix(n_points)
+        for n_sides in args.sides:
+            check_agreement(path, wire_radius, n_sides)
+            old = best_time(lambda: loop_spring_wire(path, wire_radius, n_sides), args.repeat)
+            new = best_time(lambda: mesh_utils.make_spring_wire(path, wire_radius, n_sides), args.repeat)
+            print(f"{n_points:>7} {n_sides:>5} {old*1000:>9.2f} {new*1000:>8.2f} {old/new:>7.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Clearances between the coilover's parts across its travel.
+
+Every part is axisymmetric about the damper axis, so it is described by its
+profile: a few annular segments, each a radius interval [r_in, r_out] over a
+z interval [z_bottom, z_top] (z = 0 at the bottom of the damper body). The
+profiles follow the same inputs and positions as the 3D scene's meshes.
+Segments whose z intervals overlap are separated radially by the gap between
+their radius intervals, and segments whose radius intervals overlap are
+separated axially by the gap between their z intervals; they interfere when
+both intervals overlap. Every segment pair is tested for every travel state
+at once, so a design costs a handful of array operations rather than mesh
+intersection tests.
+
+    result = compute_clearances(CoiloverModel.from_file("my_car.sus"))
+    hit = first_interference(result)  # ((part_a, part_b), travel) or None
+
+Parts that touch by design (a spring seated on its perch) have a clearance of
+zero and don't count as interfering.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+# penetration below this is contact, mm
+CONTACT_TOLERANCE = 1e-6
+
+# Pairs that overlap by construction: the shaft slides inside the body, which
+# is profiled as a solid cylinder.
+MOUNTED_PAIRS = frozenset((
+    ("damper_body", "damper_shaft"),
+))
+
+# Result of compute_clearances for the part pairs in pairs (rows of the
+# arrays). radial / axial are the smallest clearances between the segments of
+# a pair whose z / radius intervals overlap (inf where none do), penetration
+# how far the pair's worst segments overlap in both (negative when apart),
+# all shaped (pairs, *travel.shape). first_travel is the travel where each
+# pair starts to interfere, interpolated between samples (nan if it never
+# does).
+ClearanceResult = namedtuple("ClearanceResult", (
+    "pairs",
+    "travel",
+    "radial",
+    "axial",
+    "penetration",
+    "first_travel",
+))
+
+# model toggles that change the profiles
+CLEARANCE_TOGGLES = ("use_bump", "bump_internal")
+
+def part_profiles(model, states):
+    """
+    Profiles of the parts at the travel states (STATE_DTYPE): a dict mapping
+    part names to lists of (r_in, r_out, z_bottom, z_top) segments. Values
+    broadcast against states, like the inputs of compute_states.
+    """
+    shaft_upper = states["shaft_upper_position"]
+    spring_seat = model.damper_body_length + model.lower_perch_position
+    helper_perch = states["helper_perch_position"]
+    half_thickness = model.helper_perch_thickness / 2
+    shaft_r = model.damper_shaft_diameter / 2
+    spring_r = model.spring_id / 2
+    upper_r = model.upper_perch_outer_diameter / 2
+    upper_top = shaft_upper + model.upper_perch_thickness
+
+    profiles = {
+        "damper_body": [(0.0, model.damper_body_diameter / 2, 0.0, model.damper_body_length)],
+        "damper_shaft": [(0.0, shaft_r, shaft_upper - model.shaft_length, shaft_upper)],
+        "lower_perch": [(model.damper_body_diameter / 2, model.lower_perch_outer_diameter / 2,
+                         spring_seat - model.lower_perch_thickness, spring_seat)],
+        "main_spring": [(spring_r, spring_r + model.spring_wire_diameter,
+                         spring_seat, states["spring_upper_position"] + model.spring_wire_diameter / 2)],
+        # flat ring plus the inner step ring rising from its bottom face
+        # into the helper spring, like the scene's mesh
+        "helper_perch": [
+            (model.helper_inner_diameter / 2, model.helper_outer_diameter / 2,
+             helper_perch - half_thickness, helper_perch + half_thickness),
+            (model.helper_inner_diameter / 2 - model.helper_perch_thickness, model.helper_inner_diameter / 2,
+             helper_perch - half_thickness, helper_perch - half_thickness + model.helper_inner_height),
+        ],
+        "helper_spring": [(model.helper_inner_diameter / 2, model.helper_outer_diameter / 2,
+                           states["helper_spring_lower_position"] - model.helper_wire_height / 2,
+                           states["helper_spring_upper_position"] + model.helper_wire_height / 2)],
+        # plate on the top of the shaft with the cone on top, bounded by its base ring
+        "upper_perch": [
+            (0.0, upper_r, shaft_upper, upper_top),
+            (0.0, upper_r, upper_top, upper_top + model.upper_perch_tapered_height),
+        ],
+    }
+
+    # an external bump stop rides on the shaft under the top mount; an
+    # internal one stays inside the body
+    toggles = getattr(model, "toggles", {})
+    if toggles.get("use_bump") and not toggles.get("bump_internal"):
+        profiles["bump_stop"] = [(shaft_r, model.bump_diameter / 2, shaft_upper - model.bump_height, shaft_upper)]
+    return profiles
+
+@lru_cache(maxsize=None)
+def _segment_pairs(names, counts):
+    """
+    Segment pairs to test between parts with counts[k] segments each,
+    numbered part by part in the order of names.
+    Returns (pairs, first, second): first / second are (pairs, n) arrays
+    indexing the segments of the part pairs' segment pairs. Short rows are
+    padded by pairing their first segment with index sum(counts), a segment
+    at infinity.
+    """
+    owner = [name for name, count in zip(names, counts) for _ in range(count)]
+    pairs, tests = [], []
+    for a in range(len(names)):
+        for b in range(a + 1, len(names)):
+            pair = (names[a], names[b])
+            if pair in MOUNTED_PAIRS or pair[::-1] in MOUNTED_PAIRS:
+                continue
+            pairs.append(pair)
+            tests.append([(i, j) for i, part_i in enumerate(owner) for j, part_j in enumerate(owner) if (part_i, part_j) == pair])
+
+    width = max(len(t) for t in tests)
+    padded = np.empty((len(pairs), width, 2), dtype=np.intp)
+    for k, t in enumerate(tests):
+        padded[k] = t + [(t[0][0], len(owner))] * (width - len(t))
+    return tuple(pairs), padded[..., 0], padded[..., 1]
+
+def _first_travel(penetration, travel):
+    """
+    Travel where penetration first exceeds CONTACT_TOLERANCE along the last
+    axis, linearly interpolated from the sample before; nan where it never
+    does.
+    """
+    hit = penetration > CONTACT_TOLERANCE
+    k = np.argmax(hit, axis=-1)[..., None]
+    k = np.concatenate((np.maximum(k - 1, 0), k), axis=-1)
+    p0, p1 = np.moveaxis(np.take_along_axis(penetration, k, axis=-1), -1, 0)
+    t0, t1 = np.moveaxis(np.take_along_axis(np.broadcast_to(travel, penetration.shape), k, axis=-1), -1, 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = np.where(p1 > p0, (CONTACT_TOLERANCE - p0) / (p1 - p0), 1.0)
+    return np.where(hit.any(axis=-1), t0 + np.clip(a, 0.0, 1.0) * (t1 - t0), np.nan)
+
+def compute_clearances(model, states=None, samples=150):
+    """
+    Clearances between every pair of parts over the travel states (default:
+    samples states from full droop to full bump). The travel runs along the
+    last axis of states. Returns a ClearanceResult.
+    """
+    if states is None:
+        states = model.compute_states(np.linspace(0, 1, samples))
+    travel = states["travel"]
+    profiles = part_profiles(model, states)
+    segments = [segment for part in profiles.values() for segment in part]
+    pairs, first, second = _segment_pairs(tuple(profiles), tuple(len(part) for part in profiles.values()))
+
+    # stacked segment bounds plus the padding segment at infinity
+    z = np.array(np.broadcast_arrays(travel, *(v for segment in segments for v in segment[2:]), np.inf, np.inf)[1:])
+    z_bottom, z_top = z[0::2], z[1::2]
+    # radii don't change with the travel; keep them off the travel axis
+    r = np.array(np.broadcast_arrays(*(v for segment in segments for v in segment[:2]), np.inf, np.inf))
+    r = r.reshape(r.shape[:1] + (1,) * (z.ndim - r.ndim) + r.shape[1:])
+    r_in, r_out = r[0::2], r[1::2]
+
+    # (pairs, segment pairs, *travel.shape), reduced over the segment pairs
+    radial_gap = np.maximum(r_in[second] - r_out[first], r_in[first] - r_out[second])
+    axial_gap = np.maximum(z_bottom[second] - z_top[first], z_bottom[first] - z_top[second])
+    radial = np.where(axial_gap < 0, radial_gap, np.inf).min(axis=1)
+    axial = np.where(radial_gap < 0, axial_gap, np.inf).min(axis=1)
+    penetration = -np.maximum(radial_gap, axial_gap).min(axis=1)
+
+    return ClearanceResult(
+        pairs=pairs,
+        travel=travel,
+        radial=radial,
+        axial=axial,
+        penetration=penetration,
+        first_travel=_first_travel(penetration, travel),
+    )
+
+def first_interference(result):
+    """
+    The part pair that interferes first along the travel of a single design
+    and the travel where it starts, as ((part_a, part_b), travel), or None
+    when no parts interfere.
+    """
+    first_travel = np.asarray(result.first_travel)
+    if first_travel.ndim != 1:
+        raise ValueError("first_interference needs the result of a single design")
+    if not np.any(~np.isnan(first_travel)):
+        return None
+    k = int(np.nanargmin(first_travel))
+    return result.pairs[k], float(first_travel[k])
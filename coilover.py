@@ -1,3 +1,7 @@
+import time
+_start_time = time.perf_counter()
+
+import argparse
 import json
 import os
 import sys
@@ -6,15 +10,49 @@ import numpy as np
 from PyQt5 import QtWidgets, QtCore, QtGui, sip
 from PyQt5.QtGui import QVector3D
 
-import pyqtgraph as pg
-import pyqtgraph.opengl as gl
-
-from mesh_utils import *
+import clearance
 from physics_utils import *
+from coilover_model import CORNERS
+from spring_catalog import load_catalog
+from playback import PLAYBACK_SPEEDS, PlaybackController
+from recompute_scheduler import RecomputeScheduler
+from scene_worker import SceneWorker
 from ui_panels import *
 
+_import_time = time.perf_counter() - _start_time
+
+# pyqtgraph, its OpenGL module and the mesh modules are imported by import_graphics()
+pg = gl = mesh_utils = scene_builders = None
+
+def import_graphics():
+    """
+    Import pyqtgraph and the GL mesh helpers. They are most of the startup
+    time, so the window imports them once its input panels are showing.
+    """
+    global pg, gl, mesh_utils, scene_builders
+    import pyqtgraph as pg
+    import pyqtgraph.opengl as gl
+    import mesh_utils
+    import scene_builders
+
 class CoiloverDesigner(QtWidgets.QMainWindow):
 
+    # emitted once the 3D view and force plot are first drawn
+    sceneReady = QtCore.pyqtSignal()
+
+    # colors of the rigid scene parts, by mesh name; they are drawn merged
+    # into one item in this order
+    SCENE_COLORS = {
+        "body_mesh": (0.4, 0.4, 0.4, 1),
+        "shaft_mesh": (0.8, 0.1, 0.1, 1),
+        "upper_perch": (1.0, 0.5, 0.0, 1.0),
+        "upper_cone": (1.0, 0.5, 0.0, 1.0),
+        "lower_perch": (0.0, 0.7, 1.0, 1.0),
+        "helper_perch": (1.0, 0.0, 0.8, 1.0),
+    }
+    SPRING_COLOR = (0.1, 0.1, 0.8, 1)
+    LOD_IDLE_MS = 300
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Coilover Tool")
@@ -24,12 +62,21 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
         self._loading_state = True
         self.last_saved_state_signature = None
 
+        # every edit and slider move goes through the scheduler, which runs
+        # at most one recompute per event loop pass
+        self.scheduler = RecomputeScheduler(self.update_view, self.animate, self.mark_dirty, self)
+
         # text field variables
         self.q_spring_id                    = QtWidgets.QLineEdit("63.5")   # mm
         self.q_spring_wire_diameter         = QtWidgets.QLineEdit("9.6")   # mm
         self.q_spring_free_length           = QtWidgets.QLineEdit("101.6")  # mm
         self.q_spring_rate                  = QtWidgets.QLineEdit("70.04")  # N/mm
         self.q_spring_bind_length           = QtWidgets.QLineEdit("33.83")   # mm
+        self.q_spring_catalog               = QtWidgets.QComboBox()
+        self.q_spring_catalog.addItem("No catalog loaded")
+        self.q_spring_catalog.setEnabled(False)
+        self.spring_catalog = None
+        self.catalog_query = None
 
         self.q_damper_free_length           = QtWidgets.QLineEdit("400")  # mm
         self.q_damper_comp_length           = QtWidgets.QLineEdit("250")  # mm
@@ -68,7 +115,6 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
 
         self.unit = "mm"
         self.weight_unit = "kg"
-        self.g = 9.80665
 
         self.corner_weights = {
             "front_left": QtWidgets.QLineEdit("295"),
@@ -143,7 +189,8 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
             self.q_spring_wire_diameter,
             self.q_spring_free_length,
             self.q_spring_rate,
-            self.q_spring_bind_length)
+            self.q_spring_bind_length,
+            self.q_spring_catalog)
 
         # Damper group
         damper_group = create_damper_group(
@@ -204,7 +251,7 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
         # Setup group
         setup_group, self.flip_damper_chk = create_setup_group(self.q_lower_perch_position)
 
-        vehicle_tab, self.corner_button_group = create_vehicle_tab(self.corner_weights, self.unsprung_weights, self.motion_ratios)
+        vehicle_tab, self.corner_button_group, self.corner_table = create_vehicle_tab(self.corner_weights, self.unsprung_weights, self.motion_ratios)
 
         # Assemble left‐side layout into tabs
         coilover_tab = QtWidgets.QWidget()
@@ -246,6 +293,152 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
         scroll.setWidget(left)
 
         # === Right panel: 3D view ===
+        # The GL view and force plot are built by init_scene once the window
+        # is showing; a placeholder holds their place until then.
+        self.view = None
+        self.force_plot = None
+        self.scene_placeholder = QtWidgets.QLabel("Loading 3D view…")
+        self.scene_placeholder.setAlignment(QtCore.Qt.AlignCenter)
+
+        # slider for travel
+        self.slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
+        self.slider.setFixedHeight(25)
+        self.slider.setRange(0, 100)
+        self.slider.setValue(0)
+        self.slider.valueChanged.connect(self.scheduler.request_step)
+
+        # playback of the full travel
+        self.playback = PlaybackController(self.show_playback_position, self)
+        self.play_btn = QtWidgets.QPushButton("Play")
+        self.play_btn.clicked.connect(lambda: self.playback.toggle(self.slider.value()))
+        self.loop_chk = QtWidgets.QCheckBox("Loop")
+        self.loop_chk.setChecked(self.playback.loop)
+        self.loop_chk.toggled.connect(lambda checked: setattr(self.playback, "loop", checked))
+        self.speed_combo = QtWidgets.QComboBox()
+        for speed in PLAYBACK_SPEEDS:
+            self.speed_combo.addItem(f"{speed:g}x", speed)
+        self.speed_combo.setCurrentIndex(PLAYBACK_SPEEDS.index(self.playback.speed))
+        self.speed_combo.currentIndexChanged.connect(
+            lambda i: setattr(self.playback, "speed", self.speed_combo.itemData(i)))
+        self.playback.playingChanged.connect(self.on_playing_changed)
+        self.playback.statsUpdated.connect(self.update_playback_overlay)
+        self.slider.sliderPressed.connect(self.playback.pause)
+
+        playback_row = QtWidgets.QHBoxLayout()
+        playback_row.addWidget(self.play_btn)
+        playback_row.addWidget(self.loop_chk)
+        playback_row.addWidget(QtWidgets.QLabel("Speed:"))
+        playback_row.addWidget(self.speed_combo)
+        playback_row.addStretch(1)
+
+        self.register_live_updates()
+
+        # layout them
+        splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
+        right_panel = QtWidgets.QVBoxLayout()
+
+        self.view_splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
+        self.view_splitter.addWidget(self.scene_placeholder)
+
+        w = QtWidgets.QWidget()
+        w.setLayout(right_panel)
+        right_panel.addWidget(self.view_splitter, 1)
+        right_panel.addWidget(self.slider)
+        right_panel.addLayout(playback_row)
+        splitter.addWidget(scroll)
+        splitter.addWidget(w)
+        # give left:1, right:2 proportion roughly 1/3 : 2/3
+        # Give right twice the stretch of left (i.e. ~2/3 of the width)
+        splitter.setStretchFactor(1, 1)
+        self.setCentralWidget(splitter)
+
+        # placeholders
+        self.spring_mesh = None
+        self.helper_spring_mesh = None
+        self.parts_item = None
+        self.part_meshes = {}
+        self.model = None
+        self.scene_inputs = {}
+        self.applied_generation = 0
+        self.corner_inputs = {}
+        self.animated_step = None
+        self.keyframes = None
+
+        # level of detail: coarse while the camera is orbited or panned,
+        # refined once the view has been idle for LOD_IDLE_MS. Dragging the
+        # slider only changes the springs' stretch uniforms, so it keeps the
+        # current level.
+        self.lod_coarse = False
+        self.lod_key = None
+        self.lod_timer = QtCore.QTimer(self)
+        self.lod_timer.setSingleShot(True)
+        self.lod_timer.setInterval(self.LOD_IDLE_MS)
+        self.lod_timer.timeout.connect(self.refine_lod)
+
+        self.default_project_state = self.get_project_state()
+        self.last_saved_state_signature = self.project_signature(self.default_project_state)
+        self.is_dirty = False
+        self._loading_state = False
+        self.update_window_title()
+
+        # Menus
+        file_menu = self.menuBar().addMenu("File")
+
+        new_act = QtWidgets.QAction("New Project", self)
+        new_act.setShortcut(QtGui.QKeySequence.New)
+        new_act.triggered.connect(self.new_project)
+        file_menu.addAction(new_act)
+
+        open_act = QtWidgets.QAction("Open…", self)
+        open_act.setShortcut(QtGui.QKeySequence.Open)
+        open_act.triggered.connect(self.open_project)
+        file_menu.addAction(open_act)
+
+        save_act = QtWidgets.QAction("Save", self)
+        save_act.setShortcut(QtGui.QKeySequence.Save)
+        save_act.triggered.connect(self.save_project)
+        file_menu.addAction(save_act)
+
+        save_as_act = QtWidgets.QAction("Save As…", self)
+        save_as_act.setShortcut(QtGui.QKeySequence.SaveAs)
+        save_as_act.triggered.connect(self.save_project_as)
+        file_menu.addAction(save_as_act)
+
+        file_menu.addSeparator()
+
+        catalog_act = QtWidgets.QAction("Load Spring Catalog…", self)
+        catalog_act.triggered.connect(self.open_spring_catalog)
+        file_menu.addAction(catalog_act)
+
+        # reopen the last spring catalog from its compiled cache
+        self.settings = QtCore.QSettings("coilover-tool", "coilover-tool")
+        catalog_path = self.settings.value("spring_catalog/path")
+        if catalog_path:
+            self.load_spring_catalog(catalog_path, self.settings.value("spring_catalog/unit"), quiet=True)
+
+        self.scene_scheduled = False
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.scene_scheduled:
+            # build the 3D scene on the next event loop pass, after the panels are on screen
+            self.scene_scheduled = True
+            QtCore.QTimer.singleShot(0, self.init_scene)
+
+    def init_scene(self):
+        """
+        Import the graphics modules, then build the 3D view, the force plot
+        and the initial meshes. Scheduled by the window's first paint so the
+        input panels don't wait for OpenGL.
+        """
+        if self.view is not None:
+            return
+        import_graphics()
+
+        # models and meshes are built on a worker thread, see update_view
+        self.scene_worker = SceneWorker(scene_builders.build_scene, self)
+        self.scene_worker.resultReady.connect(self.apply_scene_result)
+
         self.view = gl.GLViewWidget()
         self.view.opts['lightPosition'] = (10, 10, 40)
         self.view.opts['distance'] = 600
@@ -298,6 +491,16 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
         self.help_label.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
         self.help_label.show()
 
+        # bottom-left playback frame stats, shown once playback starts
+        self.playback_label = QtWidgets.QLabel(self.view)
+        self.playback_label.setStyleSheet("""
+            color: white;
+            background-color: rgba(0,0,0,0);
+            font-size: 10pt;
+        """)
+        self.playback_label.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+        self.playback_label.hide()
+
         # Spring force plot
         self.force_plot = pg.PlotWidget()
         self.force_plot.setBackground('#111')
@@ -321,43 +524,13 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
         axis.setSize(100,100,100)
         self.view.addItem(axis)
 
-        # slider for travel
-        self.slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
-        self.slider.setFixedHeight(25)
-        self.slider.setRange(0, 100)
-        self.slider.setValue(0)
-        self.slider.valueChanged.connect(self.animate)
-
-        self.register_live_updates()
-
-        # layout them
-        splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
-        right_panel = QtWidgets.QVBoxLayout()
-
-        view_splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
-        view_splitter.addWidget(self.view)
-        view_splitter.addWidget(self.force_plot)
-        view_splitter.setStretchFactor(0, 1)
-        view_splitter.setStretchFactor(1, 1)
-
-        w = QtWidgets.QWidget()
-        w.setLayout(right_panel)
-        right_panel.addWidget(view_splitter, 1)
-        right_panel.addWidget(self.slider)
-        splitter.addWidget(scroll)
-        splitter.addWidget(w)
-        # give left:1, right:2 proportion roughly 1/3 : 2/3
-        # Give right twice the stretch of left (i.e. ~2/3 of the width)
-        splitter.setStretchFactor(1, 1)
-        self.setCentralWidget(splitter)
-
-        # placeholders
-        self.spring_mesh = None
-        self.body_mesh   = None
-        self.shaft_mesh  = None
-        self.upper_perch = None
-        self.upper_cone  = None
-        self.helper_spring_mesh = None
+        self.view_splitter.replaceWidget(0, self.view)
+        self.view_splitter.addWidget(self.force_plot)
+        self.view_splitter.setStretchFactor(0, 1)
+        self.view_splitter.setStretchFactor(1, 1)
+        self.scene_placeholder.deleteLater()
+        self.view.installEventFilter(self)
+        self.reset_view_btn.installEventFilter(self)
 
         # Have the camera center on the top of the damper body
         self.view.opts['center'] = QVector3D(0, 0, self.read_length(self.q_damper_body_length))
@@ -371,67 +544,36 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
             "azimuth": self.view.opts.get("azimuth"),
         }
 
-        # initial draw
+        # initial draw, sceneReady follows once the worker's result is applied
         self.update_view()
-        self.default_project_state = self.get_project_state()
-        self.last_saved_state_signature = self.project_signature(self.default_project_state)
-        self.is_dirty = False
-        self._loading_state = False
-        self.update_window_title()
-
-        # Menus
-        file_menu = self.menuBar().addMenu("File")
-
-        new_act = QtWidgets.QAction("New Project", self)
-        new_act.setShortcut(QtGui.QKeySequence.New)
-        new_act.triggered.connect(self.new_project)
-        file_menu.addAction(new_act)
-
-        open_act = QtWidgets.QAction("Open…", self)
-        open_act.setShortcut(QtGui.QKeySequence.Open)
-        open_act.triggered.connect(self.open_project)
-        file_menu.addAction(open_act)
-
-        save_act = QtWidgets.QAction("Save", self)
-        save_act.setShortcut(QtGui.QKeySequence.Save)
-        save_act.triggered.connect(self.save_project)
-        file_menu.addAction(save_act)
-
-        save_as_act = QtWidgets.QAction("Save As…", self)
-        save_as_act.setShortcut(QtGui.QKeySequence.SaveAs)
-        save_as_act.triggered.connect(self.save_project_as)
-        file_menu.addAction(save_as_act)
 
     def register_live_updates(self):
         """
         Connect inputs and toggles so the view refreshes automatically.
         """
         for widget in self.input_fields.values():
-            widget.editingFinished.connect(self.update_view)
-            widget.editingFinished.connect(self.mark_dirty)
-
-        self.helper_chk.toggled.connect(self.update_view)
-        self.helper_chk.toggled.connect(self.mark_dirty)
-        self.helper_above.toggled.connect(self.update_view)
-        self.helper_above.toggled.connect(self.mark_dirty)
-        self.helper_below.toggled.connect(self.update_view)
-        self.helper_below.toggled.connect(self.mark_dirty)
-        self.bump_chk.toggled.connect(self.update_view)
-        self.bump_chk.toggled.connect(self.mark_dirty)
-        self.radio_bump_ext.toggled.connect(self.update_view)
-        self.radio_bump_ext.toggled.connect(self.mark_dirty)
-        self.radio_bump_int.toggled.connect(self.update_view)
-        self.radio_bump_int.toggled.connect(self.mark_dirty)
-        self.lower_perch_adjustable_chk.toggled.connect(self.update_view)
-        self.lower_perch_adjustable_chk.toggled.connect(self.mark_dirty)
-        self.lower_perch_sleeve_chk.toggled.connect(self.update_view)
-        self.lower_perch_sleeve_chk.toggled.connect(self.mark_dirty)
-        self.flip_damper_chk.toggled.connect(self.update_view)
-        self.flip_damper_chk.toggled.connect(self.mark_dirty)
-        self.corner_button_group.buttonClicked.connect(lambda _: self.update_view())
-        self.corner_button_group.buttonClicked.connect(lambda _: self.mark_dirty())
-        self.view.installEventFilter(self)
-        self.reset_view_btn.installEventFilter(self)
+            widget.editingFinished.connect(self.request_edit)
+
+        for toggle in (
+            self.helper_chk,
+            self.helper_above,
+            self.helper_below,
+            self.bump_chk,
+            self.radio_bump_ext,
+            self.radio_bump_int,
+            self.lower_perch_adjustable_chk,
+            self.lower_perch_sleeve_chk,
+            self.flip_damper_chk,
+        ):
+            toggle.toggled.connect(self.request_edit)
+        self.corner_button_group.buttonClicked.connect(self.request_edit)
+        self.q_spring_catalog.activated.connect(self.on_catalog_spring_selected)
+
+    def request_edit(self, *_):
+        """
+        Schedule a recompute for a user edit and re-check the unsaved flag.
+        """
+        self.scheduler.request_update(dirty=not self._loading_state)
 
     def on_unit_changed(self):
         """
@@ -543,15 +685,52 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
 
         self.unit = "in" if new_unit_mode=="imperial" else "mm"
         self.weight_unit = "lb" if new_unit_mode=="imperial" else "kg"
-        self.update_view()
+        self.scheduler.request_update()
 
     def eventFilter(self, obj, event):
         if obj is self.view and event.type() == QtCore.QEvent.Resize:
-            if hasattr(self, "spring_bottom_position"):
+            if self.model is not None:
                 self.animate(self.slider.value())
             self.position_reset_button()
+            if self.playback_label.isVisible():
+                self.update_playback_overlay()
+            self.refresh_lod()
+        elif obj is self.view and event.type() == QtCore.QEvent.MouseMove and event.buttons():
+            self.begin_interaction()  # orbiting or panning
+        elif obj is self.view and event.type() in (QtCore.QEvent.MouseButtonRelease, QtCore.QEvent.Wheel):
+            self.end_interaction()  # zoom is picked up once idle
         return super().eventFilter(obj, event)
 
+    def view_pixels_per_mm(self):
+        """
+        On-screen scale at the camera center, rounded to half powers of two
+        so small zoom changes don't rebuild the meshes.
+        """
+        if self.view is None or self.view.width() <= 0:
+            return None
+        pixels_per_mm = 1 / self.view.pixelSize(self.view.opts['center'])
+        return 2 ** (round(2 * np.log2(pixels_per_mm)) / 2)
+
+    def refresh_lod(self):
+        """
+        Rebuild the scene if its level of detail no longer matches the view.
+        """
+        if self.view is not None and (self.view_pixels_per_mm(), self.lod_coarse) != self.lod_key:
+            self.scheduler.request_update()
+
+    def begin_interaction(self):
+        self.lod_timer.stop()
+        if not self.lod_coarse:
+            self.lod_coarse = True
+            self.refresh_lod()
+
+    def end_interaction(self):
+        self.lod_timer.start()
+
+    def refine_lod(self):
+        self.lod_coarse = False
+        self.refresh_lod()
+
     def on_helper_toggled(self):
         """
         Toggle helper spring
@@ -574,8 +753,7 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
             self.q_helper_spring_bind_length
         ):
             w.setEnabled(self.use_helper)
-        if hasattr(self, "view"):
-            self.update_view()
+        self.scheduler.request_update()
 
     def on_bump_toggled(self):
         """
@@ -593,16 +771,14 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
             self.q_bump_rate,
         ):
             w.setEnabled(self.use_bump)
-        if hasattr(self, "view"):
-            self.update_view()
+        self.scheduler.request_update()
 
     def on_lower_perch_adj_toggled(self, checked):
         """
         Enable lower perch position input when adjustable perch is selected.
         """
         self.q_lower_perch_position.setEnabled(bool(checked))
-        if hasattr(self, "view"):
-            self.update_view()
+        self.scheduler.request_update()
 
     def lower_perch_sleeve_chk_toggled(self, checked):
         """
@@ -613,8 +789,7 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
             self.q_lower_perch_sleeve_inner_diameter,
         ):
             w.setEnabled(bool(checked))
-        if hasattr(self, "view"):
-            self.update_view()
+        self.scheduler.request_update()
 
     def position_reset_button(self):
         """
@@ -639,366 +814,170 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
             return val * 25.4  # convert inches back to mm
         return val            # already in mm   
 
-    def read_rate(self, widget):
+    def set_part_meshes(self, meshes):
         """
-        Read a spring rate value and convert to N/mm regardless of UI unit.
+        Update the rigid parts from a dict of mesh name -> MeshData and show
+        all of them in one MergedMeshItem. The item is kept when every part
+        still has the same (cached) MeshData; otherwise the parts are merged
+        again and the new item replaces the old one.
         """
-        val = float(widget.text())
-        if self.unit == "in":
-            return val / 5.710147162769185  # lbf/in -> N/mm
-        return val
+        meshes = {name: data for name, data in meshes.items()
+                  if self.part_meshes.get(name) is not data}
+        if not meshes and self.parts_item is not None:
+            return self.parts_item
+        self.part_meshes.update(meshes)
+
+        if self.parts_item is not None:
+            self.view.removeItem(self.parts_item)
+        self.parts_item = mesh_utils.MergedMeshItem(
+            [self.part_meshes[name] for name in self.SCENE_COLORS],
+            list(self.SCENE_COLORS.values()),
+            smooth=True,
+            glOptions='opaque',      # so it renders solid faces
+            computeNormals=True      # makes GLMeshItem read the normals seeded by mesh_utils._mesh_with_normals
+        )
+        self.view.addItem(self.parts_item)
+        return self.parts_item
 
-    def read_mass(self, widget):
+    def set_spring_mesh(self, attr, meshdata, path):
         """
-        Read a weight entry and return kilograms regardless of UI unit.
+        Show a spring sweep along path (at rest) in a new SpringItem stored
+        on attr; apply_state compresses it on the GPU.
         """
-        val = float(widget.text())
-        if self.weight_unit == "lb":
-            return val * 0.45359237
-        return val
+        item = getattr(self, attr)
+        if item is not None:
+            self.view.removeItem(item)
+        item = mesh_utils.SpringItem(
+            path[:, 2],
+            meshdata=meshdata,
+            smooth=True,
+            color=self.SPRING_COLOR,
+            glOptions='opaque',      # so it renders solid faces
+            computeNormals=True      # makes GLMeshItem read the normals seeded by mesh_utils._mesh_with_normals
+            )
+        setattr(self, attr, item)
+        self.view.addItem(item)
+        return item
 
-    def get_selected_corner_key(self):
+    def update_view(self):
         """
-        Map the selected radio button to the corner key.
+        Update and render the 3D visualization.
+        The model, force curve and meshes are built from a snapshot of the
+        inputs on the scene worker thread; apply_scene_result shows them.
+        Only scene parts whose inputs or level of detail changed since the last
+        update are rebuilt.
         """
-        btn = self.corner_button_group.checkedButton()
-        text = btn.text() if btn else ""
-        mapping = {
-            "Front Left": "front_left",
-            "Front Right": "front_right",
-            "Rear Left": "rear_left",
-            "Rear Right": "rear_right",
-        }
-        return mapping.get(text, "front_left")
-
-    def compute_corner_load(self):
+        if self.view is None:
+            return  # init_scene draws once the view exists
+        pixels_per_mm = self.view_pixels_per_mm()
+        self.lod_key = (pixels_per_mm, self.lod_coarse)
+        self.scene_worker.submit(self.get_project_state(), dict(self.scene_inputs),
+                                 pixels_per_mm=pixels_per_mm, coarse=self.lod_coarse)
+
+    def finish_scene_update(self):
         """
-        Return the target coilover force for the selected corner.
+        Wait for the scene worker and apply its latest result right away.
         """
-        corner_key = self.get_selected_corner_key()
-        try:
-            corner_mass = self.read_mass(self.corner_weights[corner_key])
-            unsprung_mass = self.read_mass(self.unsprung_weights[corner_key])
-            motion_ratio = float(self.motion_ratios[corner_key].text())
-        except ValueError:
-            return None
+        done = self.scene_worker.wait()
+        if done is not None and done[1] is not None:
+            self.apply_scene_result(*done)
 
-        motion_ratio = max(motion_ratio, 0.0)
-        sprung_mass = max(corner_mass - unsprung_mass, 0.0)
-        sprung_force = sprung_mass * self.g  # N at the wheel
-        coilover_force = sprung_force * motion_ratio
-
-        return {
-            "corner_mass": corner_mass,
-            "unsprung_mass": unsprung_mass,
-            "motion_ratio": motion_ratio,
-            "sprung_force": sprung_force,
-            "coilover_force": coilover_force,
-        }
-
-    def update_view(self):
+    def apply_scene_result(self, generation, result):
         """
-        Update and render the 3D visualization
+        Show a scene worker result. Results of older requests are dropped,
+        latest request wins.
         """
-        try:
-            self.spring_id = self.read_length(self.q_spring_id)
-            self.spring_wire_diameter = self.read_length(self.q_spring_wire_diameter)
-            self.spring_free_length = self.read_length(self.q_spring_free_length)
-            self.spring_bind_length = self.read_length(self.q_spring_bind_length)
-            self.spring_rate = self.read_rate(self.q_spring_rate)
-            self.damper_body_diameter = self.read_length(self.q_damper_body_diameter)
-            self.damper_body_length = self.read_length(self.q_damper_body_length)
-            self.damper_shaft_diameter = self.read_length(self.q_damper_shaft_diameter)
-            self.lower_perch_position = self.read_length(self.q_lower_perch_position)
-            self.damper_free_length = self.read_length(self.q_damper_free_length)
-            self.damper_comp_length = self.read_length(self.q_damper_comp_length)
-            self.helper_perch_thickness = self.read_length(self.q_helper_perch_thickness)
-            self.helper_outer_diameter = self.read_length(self.q_helper_outer_diameter)
-            self.helper_inner_diameter = self.read_length(self.q_helper_inner_diameter)
-            self.helper_inner_height = self.read_length(self.q_helper_inner_height)
-            self.helper_spring_id = self.read_length(self.q_helper_spring_id)
-            self.helper_spring_od = self.read_length(self.q_helper_spring_od)
-            self.helper_spring_free_length = self.read_length(self.q_helper_spring_free_length)
-            self.helper_spring_rate = self.read_rate(self.q_helper_spring_rate)
-            self.helper_spring_bind_length = self.read_length(self.q_helper_spring_bind_length)
-        except ValueError:
+        if generation <= self.applied_generation or self.scene_worker.is_stale(generation):
             return
+        self.applied_generation = generation
+        first_build = not self.scene_inputs
 
-        self.shaft_length = self.damper_comp_length #TODO fix this simplificiation
-        hole_r = (self.read_length(self.q_helper_inner_diameter) - 2 * self.helper_perch_thickness) / 2.0 # second ring’s hole radius:
-
-        # Clear old mesh geometry
-        for item in [
-            self.spring_mesh,
-            self.body_mesh,
-            self.shaft_mesh,
-            self.upper_perch,
-            self.upper_cone,
-            self.helper_spring_mesh
-            ]:
-            if item: self.view.removeItem(item)
-
-        # Create damper body
-        cyl = make_cylinder(self.damper_body_diameter/2, self.damper_body_length, 32)
-        self.body_mesh = gl.GLMeshItem(
-            meshdata=cyl,
-            smooth=True, 
-            color=(0.4,0.4,0.4,1),
-            shader='shaded',         # turn on per‐vertex lighting
-            glOptions='opaque',      # so it renders solid faces
-            computeNormals=True      # auto-generate normals from faces
-        )
-        self.body_mesh.translate(0, 0, self.damper_body_length/2) # bottom of damper body is the origin
-        self.view.addItem(self.body_mesh)
+        self.model = result.model
+        self.scene_inputs = result.inputs
+        if result.keyframes is not None:
+            self.keyframes = result.keyframes
 
-        # Create damper shaft
-        shaft = make_cylinder(self.damper_shaft_diameter/2, self.shaft_length, 16)
-        self.shaft_mesh = gl.GLMeshItem(
-            meshdata=shaft,
-            smooth=True,
-            color=(0.8,0.1,0.1,1),
-            shader='shaded',         # turn on per‐vertex lighting
-            glOptions='opaque',      # so it renders solid faces
-            computeNormals=True      # auto-generate normals from faces
-        )
-        self.shaft_mesh.translate(0, 0, (self.shaft_length/2 + (self.damper_free_length - self.damper_comp_length)))
-        self.view.addItem(self.shaft_mesh)
-
-        # Create main spring helix
-        self.coils = calculate_active_coils(50, self.spring_wire_diameter, self.spring_id)
-        theta  = np.linspace(0, 2*np.pi*self.coils, 200)
-        self.spring_x = ((self.spring_id + self.spring_wire_diameter)/2) * np.cos(theta)
-        self.spring_y = ((self.spring_id + self.spring_wire_diameter)/2) * np.sin(theta)
-        self.main_theta = theta
-
-        # Create main spring geometry
-        self.spring_bottom_position = self.damper_body_length + self.lower_perch_position + self.spring_wire_diameter / 2 # Z coordinate where the bottom spring wire's center sits
-        self.spring_upper_position = self.spring_bottom_position + self.spring_free_length - self.spring_wire_diameter # Z coordinate where the top spring wire's center sits
-        pts = np.vstack((self.spring_x, self.spring_y, np.linspace(self.spring_bottom_position, self.spring_upper_position, self.main_theta.size))).T
-        wire = make_spring_wire(pts, self.spring_wire_diameter/2)
-        self.spring_mesh = gl.GLMeshItem(
-            meshdata=wire,
-            smooth=True,
-            color=(0.1,0.1,0.8,1),
-            shader='shaded',         # turn on per‐vertex lighting
-            glOptions='opaque',      # so it renders solid faces
-            computeNormals=True      # auto-generate normals from faces
-            )
-        self.view.addItem(self.spring_mesh)
-
-        # Create helper spring helix
-        self.helper_wire_width = (self.helper_outer_diameter - self.helper_inner_diameter) / 2
-        self.helper_coils, self.helper_wire_height = calculate_active_coils_rectangular(
-            spring_rate=self.helper_spring_rate,
-            inner_diameter=self.helper_inner_diameter,
-            outer_diameter=self.helper_outer_diameter,
-            shear_modulus=80e3,
-            wire_width=self.helper_wire_width,
-            solid_height=self.helper_spring_bind_length
-        )
-        self.helper_spring_lower_position = self.spring_upper_position + self.spring_wire_diameter / 2 + self.helper_perch_thickness + self.helper_wire_height / 2 # Z coordinate where the bottom spring wire's center sits
-        self.helper_spring_upper_position = self.helper_spring_lower_position + self.helper_spring_free_length - self.helper_wire_height # Z coordinate where the top spring wire's center sits
-        theta  = np.linspace(0, 2 * np.pi * self.helper_coils, 200)
-        r = (self.helper_inner_diameter + self.helper_wire_width) / 2
-        self.helper_spring_x = r * np.cos(theta)
-        self.helper_spring_y = r * np.sin(theta)
-        self.helper_theta = theta
-
-        # Create helper spring geometry
-        pts = np.vstack((self.helper_spring_x, self.helper_spring_y, np.linspace(self.helper_spring_lower_position, self.helper_spring_upper_position, self.helper_theta.size))).T
-        wire = make_rectangular_spring_wire(pts, self.helper_wire_width, self.helper_wire_height)
-        self.helper_spring_mesh = gl.GLMeshItem(
-            meshdata=wire,
-            smooth=True,
-            color=(0.1,0.1,0.8,1),
-            shader='shaded',         # turn on per‐vertex lighting
-            glOptions='opaque',      # so it renders solid faces
-            computeNormals=True      # auto-generate normals from faces
-            )
-        self.view.addItem(self.helper_spring_mesh)
-
-        # Upper spring perch
-        perch_clearance  = 2.0       # mm beyond spring OD
-        cyl_thickness    = 5.0       # cylinder height
-        cone_height      = 10.0      # cone height
-        plate_dia        = 87
-
-        cyl_mesh = make_cylinder(plate_dia/2.0, cyl_thickness, sectors=32)
-        self.upper_perch = gl.GLMeshItem(
-            meshdata=cyl_mesh, smooth=True,
-            color=(1.0, 0.5, 0.0, 1.0),
-            shader='shaded', glOptions='opaque', computeNormals=True
-        )
-        # center its bottom on spring_top_z:
-        cyl_center_z = self.damper_free_length + cyl_thickness/2.0
-        self.upper_perch.translate(0, 0, cyl_center_z)
-        self.view.addItem(self.upper_perch)
-
-        # Build cone for upper perch
-        # Build base ring
-        n_segs = 32
-        angles = np.linspace(0, 2*np.pi, n_segs, endpoint=False)
-        base_pts = np.vstack([
-            plate_dia/2.0*np.cos(angles),
-            plate_dia/2.0*np.sin(angles),
-            np.full_like(angles, self.damper_free_length + cyl_thickness)
-        ]).T
-        # tip vertex
-        tip = np.array([0, 0, self.damper_free_length + cyl_thickness + cone_height])
-
-        # assemble verts & faces
-        verts = np.vstack([base_pts, tip])
-        faces = []
-        tip_idx = len(verts) - 1
-        for i in range(n_segs):
-            a = i
-            b = (i+1) % n_segs
-            # triangle (a, b, tip)
-            faces.append([a, b, tip_idx])
-
-        cone_mesh = gl.MeshData(vertexes=verts, faces=np.array(faces))
-        self.upper_cone = gl.GLMeshItem(
-            meshdata=cone_mesh, smooth=True,
-            color=(1.0, 0.5, 0.0, 1.0),
-            shader='shaded', glOptions='opaque', computeNormals=True
-        )
-        self.view.addItem(self.upper_cone)
-
-        # Lower spring perch
-        perch_clearance  = 2.0       # mm beyond spring OD
-        cyl_thickness    = 10.0       # cylinder height
-        cone_height      = 10.0      # cone height
-        plate_dia        = 87
-
-        # remove old perch if exists
-        if hasattr(self, 'lower_perch'):
-            self.view.removeItem(self.lower_perch)
-
-        cyl_mesh = make_cylinder(plate_dia/2.0, cyl_thickness, sectors=32)
-        self.lower_perch = gl.GLMeshItem(
-            meshdata=cyl_mesh, smooth=True,
-            color=(0.0, 0.7, 1.0, 1.0),
-            shader='shaded', glOptions='opaque', computeNormals=True
-        )
-        # center its top on spring_top_z:
-        lower_perch_z = self.damper_body_length - cyl_thickness/2.0 + self.lower_perch_position
-        self.lower_perch.translate(0, 0, lower_perch_z)
-        self.view.addItem(self.lower_perch)
-
-        # helper spring perch
-        # --- remove old helper perch if present ---
-        if hasattr(self, 'helper_perch'):
-            self.view.removeItem(self.helper_perch)
-
-        # --- build the two annular meshes ---
-        md1 = make_annular_cylinder(self.helper_outer_diameter / 2,   self.helper_inner_diameter / 2, self.helper_perch_thickness, sectors=64)
-        md2 = make_annular_cylinder(self.helper_inner_diameter / 2, hole_r, self.helper_inner_height, sectors=64)
-
-        # --- merge them into one mesh ---
-        v1, f1 = md1.vertexes(), md1.faces()
-        v2, f2 = md2.vertexes(), md2.faces()
-        verts = np.vstack([v1, v2])
-        faces = np.vstack([f1, f2 + len(v1)])
-        helper_mesh = gl.MeshData(vertexes=verts, faces=faces)
-
-        # --- create the GL item ---
-        self.helper_perch = gl.GLMeshItem(
-            meshdata=helper_mesh, smooth=True,
-            color=(1.0, 0.0, 0.8, 1.0), shader='shaded',
-            glOptions='opaque', computeNormals=True
-        )
-
-        self.helper_perch.translate(0, 0, (self.damper_body_length + self.lower_perch_position + self.spring_free_length + self.helper_perch_thickness/2))
-        self.view.addItem(self.helper_perch)
+        for attr, data in result.meshes.items():
+            if attr in ("spring_path", "helper_spring_path"):
+                setattr(self, attr, data)
+            elif attr == "spring_mesh":
+                self.set_spring_mesh(attr, data, result.meshes["spring_path"])
+            elif attr == "helper_spring_mesh":
+                self.set_spring_mesh(attr, data, result.meshes["helper_spring_path"])
+        self.set_part_meshes({name: data for name, data in result.meshes.items() if name in self.SCENE_COLORS})
 
+        self.refresh_spring_catalog()
 
         # travel info
-        self.compute_force_curve()
-        self.animate(self.slider.value())
+        self.travel_vals = result.travel_vals
+        self.force_vals = result.force_vals
+        if result.clearances is not None:
+            self.interference = clearance.first_interference(result.clearances)
+        self.update_force_plot(result.ride_state)
+        self.update_corner_table(first_build or bool(result.changed))
+        if result.changed or self.slider.value() != self.animated_step:
+            self.animate(self.slider.value())
+        else:
+            self.update_overlay(self.current_state)
         self.position_reset_button()
 
-    def compute_state(self, f):
+        if first_build:
+            self.sceneReady.emit()
+
+    def refresh_spring_catalog(self):
         """
-        Calculate geometry and force state for a normalized travel fraction f (0–1).
+        List the catalog springs that match the current spring ID and fit
+        between the lower perch and the top mount at full droop.
         """
-        min_shaft_position = max(
-            self.damper_comp_length,
-            (self.spring_bottom_position - self.spring_wire_diameter / 2 + self.spring_bind_length + self.helper_spring_bind_length + self.helper_perch_thickness)
-        )
-
-        shaft_upper_position = self.damper_free_length - (self.damper_free_length - min_shaft_position) * f
-
-        # available_length: this not the available travel
-        available_spring_length = shaft_upper_position - (self.spring_bottom_position - self.spring_wire_diameter / 2) - self.helper_perch_thickness
-
-        available_length = available_spring_length - self.spring_bind_length - self.helper_spring_bind_length
-
-        spring_length, helper_spring_length, spring_force = split_strut_length_to_springs(
-            self.spring_rate,
-            self.helper_spring_rate,
-            available_spring_length,
-            self.spring_bind_length,
-            self.helper_spring_bind_length,
-            self.spring_free_length,
-            self.helper_spring_free_length
-        )
-
-        spring_upper_position = self.spring_bottom_position + (spring_length - self.spring_wire_diameter)
-        helper_perch_position = spring_upper_position + self.spring_wire_diameter / 2 + self.helper_perch_thickness / 2
-        helper_spring_lower_position = helper_perch_position + self.helper_perch_thickness / 2 + self.helper_wire_height / 2
-        helper_spring_upper_position = helper_spring_lower_position + (helper_spring_length - self.helper_wire_height)
-
-        travel = self.damper_free_length - shaft_upper_position
+        if self.spring_catalog is None or self.model is None:
+            return
 
-        return {
-            "min_shaft_position": min_shaft_position,
-            "shaft_upper_position": shaft_upper_position,
-            "available_length": available_length,
-            "spring_length": spring_length,
-            "helper_spring_length": helper_spring_length,
-            "spring_force": spring_force,
-            "spring_upper_position": spring_upper_position,
-            "helper_perch_position": helper_perch_position,
-            "helper_spring_lower_position": helper_spring_lower_position,
-            "helper_spring_upper_position": helper_spring_upper_position,
-            "travel": travel,
-        }
+        # room for the main spring with the helper stack at bind
+        model = self.model
+        max_free_length = (model.damper_free_length - (model.spring_bottom_position - model.spring_wire_diameter / 2)
+                           - model.helper_perch_thickness - model.helper_spring_bind_length)
+        query = (id(self.spring_catalog), model.spring_id, max_free_length, self.unit)
+        if query == self.catalog_query:
+            return
+        self.catalog_query = query
+
+        selected = self.q_spring_catalog.currentData()
+        matches = self.spring_catalog.query(inner_diameter=model.spring_id, max_free_length=max_free_length)
+
+        length_scale = 1 / 25.4 if self.unit == "in" else 1.0
+        rate_scale = 5.710147162769185 if self.unit == "in" else 1.0
+        rate_suffix = "lbf/in" if self.unit == "in" else "N/mm"
+
+        self.q_spring_catalog.blockSignals(True)
+        self.q_spring_catalog.clear()
+        self.q_spring_catalog.addItem(f"{matches.size} matching springs")
+        for i in matches:
+            self.q_spring_catalog.addItem(
+                f"{self.spring_catalog.part_number[i]}: {self.spring_catalog.rate[i] * rate_scale:.1f} {rate_suffix}, "
+                f"{self.spring_catalog.free_length[i] * length_scale:.2f} {self.unit} free",
+                int(i)
+            )
+        self.q_spring_catalog.setCurrentIndex(max(self.q_spring_catalog.findData(selected), 0) if selected is not None else 0)
+        self.q_spring_catalog.blockSignals(False)
 
-    def compute_ride_height(self, travel_vals, force_vals):
+    def on_catalog_spring_selected(self, index):
         """
-        Calculate ride height position where spring force balances corner load.
+        Fill the spring fields from the chosen catalog entry.
         """
-        if travel_vals.size == 0 or force_vals.size == 0:
-            return {"travel": 0.0, "force": 0.0, "rebound": 0.0, "heave": 0.0}
-
-        corner_load = self.compute_corner_load()
-        if not corner_load:
-            ride_pos = float(travel_vals[0])
-            force = float(force_vals[0])
-        else:
-            target_force = max(corner_load["coilover_force"], 0.0)
-            if target_force <= force_vals[0]:
-                ride_pos = float(travel_vals[0])
-                force = float(force_vals[0])
-            elif target_force >= force_vals[-1]:
-                ride_pos = float(travel_vals[-1])
-                force = float(force_vals[-1])
-            else:
-                ride_pos = float(np.interp(target_force, force_vals, travel_vals))
-                force = target_force
-
-        # Compute maximum travel
-        max_travel = self.damper_free_length - (self.spring_bottom_position - self.spring_wire_diameter / 2) - self.helper_perch_thickness - self.spring_bind_length - self.helper_spring_bind_length
+        i = self.q_spring_catalog.itemData(index)
+        if i is None:
+            return
+        spring = self.spring_catalog.entry(i)
 
-        rebound_travel = ride_pos # the amount the damper compresses at ride height is the maximum possible rebound travel
-        heave_travel = max_travel - rebound_travel
+        length_scale = 1 / 25.4 if self.unit == "in" else 1.0
+        rate_scale = 5.710147162769185 if self.unit == "in" else 1.0
+        self.q_spring_id.setText(f"{spring['inner_diameter'] * length_scale:.3f}")
+        self.q_spring_wire_diameter.setText(f"{spring['wire_diameter'] * length_scale:.3f}")
+        self.q_spring_free_length.setText(f"{spring['free_length'] * length_scale:.3f}")
+        self.q_spring_bind_length.setText(f"{spring['bind_length'] * length_scale:.3f}")
+        self.q_spring_rate.setText(f"{spring['rate'] * rate_scale:.3f}")
 
-        return {
-            "ride_height_position": ride_pos,
-            "force": force,
-            "rebound_travel": rebound_travel,
-            "heave_travel": heave_travel,
-        }
+        self.scheduler.request_update(dirty=True)
 
     def split_force_curve_for_plot(self, travel_vals, force_vals, ride_travel):
         """
@@ -1022,24 +1001,13 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
         heave_f = np.concatenate([[ride_force], force_vals[idx:]])
         return rebound_t, rebound_f, heave_t, heave_f
 
-    def compute_force_curve(self, samples=150):
+    def update_force_plot(self, ride_state):
         """
-        Calculate spring force across the full travel for plotting and ride height.
+        Plot the spring force across the full travel, split at ride height.
         """
-        travel_vals = []
-        force_vals = []
-        for f in np.linspace(0, 1, samples):
-            state = self.compute_state(float(f))
-            travel_vals.append(state["travel"])
-            force_vals.append(state["spring_force"])
-
-        self.travel_vals = np.array(travel_vals)
-        self.force_vals = np.array(force_vals)
+        self.total_travel = float(self.travel_vals[-1]) if self.travel_vals.size else 0.0
 
-        self.total_travel = float(self.travel_vals[-1]) if travel_vals else 0.0
-
-        # Compute static ride-height parameters
-        ride_state = self.compute_ride_height(self.travel_vals, self.force_vals)
+        # static ride-height parameters
         self.ride_height_travel = ride_state["ride_height_position"]
         self.ride_height_force = ride_state["force"]
         self.rebound_available = ride_state["rebound_travel"]
@@ -1060,11 +1028,11 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
             self.force_curve_heave.clear()
 
         # Keep axes reasonable when values are constant/zero
-        x_max = float(np.max(self.travel_vals)) if travel_vals else 1
+        x_max = float(np.max(self.travel_vals)) if self.travel_vals.size else 1
         if x_max == 0:
             x_max = 1
         self.force_plot.setXRange(0, x_max, padding=0.02)
-        if force_vals:
+        if self.force_vals.size:
             y_min = float(np.min(self.force_vals))
             y_max = float(np.max(self.force_vals))
             if y_min == y_max:
@@ -1073,6 +1041,28 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
             y_span_max = y_max if y_max != 0 else 1
             self.force_plot.setYRange(y_min, y_span_max * 1.05, padding=0.05)
 
+    def update_corner_table(self, curve_changed):
+        """
+        Refresh the all-corners ride height table. Only the corners whose
+        weights or motion ratio changed are recomputed, unless the force
+        curve itself changed.
+        """
+        corner_inputs = {
+            corner: tuple(getattr(self.model, f"{kind}_{corner}") for kind in ("corner_weight", "unsprung_weight", "motion_ratio"))
+            for corner in CORNERS
+        }
+        stale = [corner for corner in CORNERS if curve_changed or self.corner_inputs.get(corner) != corner_inputs[corner]]
+        self.corner_inputs = corner_inputs
+        if not stale:
+            return
+
+        ride_states = self.model.compute_ride_heights(self.travel_vals, self.force_vals, stale)
+        for i, corner in enumerate(stale):
+            col = CORNERS.index(corner)
+            known = None not in corner_inputs[corner]
+            for row, (key, _) in enumerate(CORNER_SUMMARY_ROWS):
+                self.corner_table.item(row, col).setText(f"{ride_states[key][i]:.1f}" if known else "–")
+
     def update_force_marker(self, state):
         """
         Move the indicator point to the current slider position.
@@ -1084,52 +1074,58 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
         """
         Update meshes, labels, and overlays for a given state snapshot.
         """
-        self.shaft_upper_position = state["shaft_upper_position"]
-        self.spring_upper_position = state["spring_upper_position"]
-        self.helper_perch_position = state["helper_perch_position"]
-        self.helper_spring_lower_position = state["helper_spring_lower_position"]
-        self.helper_spring_upper_position = state["helper_spring_upper_position"]
+        model = self.model
+        shaft_upper_position = state["shaft_upper_position"]
+        self.current_state = state
+
+        # Stretch the springs between their perches; the rest-pose meshes
+        # stay on the GPU and only the stretch uniforms change. The paths
+        # hold the rest heights the meshes were built with.
+        self.spring_mesh.setStretch(*scene_builders.spring_stretch(
+            self.spring_path[0, 2], self.spring_path[-1, 2],
+            model.spring_bottom_position, state["spring_upper_position"]))
+        self.helper_spring_mesh.setStretch(*scene_builders.spring_stretch(
+            self.helper_spring_path[0, 2], self.helper_spring_path[-1, 2],
+            state["helper_spring_lower_position"], state["helper_spring_upper_position"]))
+
+        # Place the rigid parts; they share one item, so this only sets its
+        # offsets uniform
+        part_z = {
+            "body_mesh": model.damper_body_length/2, # bottom of damper body is the origin
+            "shaft_mesh": shaft_upper_position - model.shaft_length/2,
+            "upper_perch": shaft_upper_position + model.upper_perch_thickness/2,
+            "upper_cone": shaft_upper_position + model.upper_perch_thickness,
+            # center the lower perch's top on the spring seat
+            "lower_perch": model.damper_body_length - model.lower_perch_thickness/2.0 + model.lower_perch_position,
+            "helper_perch": state["helper_perch_position"],
+        }
+        self.parts_item.setPartOffsets([part_z[name] for name in self.SCENE_COLORS])
 
+        self.update_overlay(state)
+
+    def update_overlay(self, state):
+        """
+        Refresh the overlay text for a state snapshot and the latest ride height.
+        """
         spring_length = state["spring_length"]
         helper_spring_length = state["helper_spring_length"]
         available_length = state["available_length"]
         spring_force = state["spring_force"]
 
-        # Regenerate the main spring helix
-        zs = np.linspace(self.spring_bottom_position, self.spring_upper_position, self.main_theta.size)
-        pts = np.vstack((self.spring_x, self.spring_y, zs)).T
-        new_wire = make_spring_wire(pts, self.spring_wire_diameter/2)
-        self.spring_mesh.setMeshData(meshdata=new_wire)
-
-        # Regenerate the helper spring helix
-        zs = np.linspace(self.helper_spring_lower_position, self.helper_spring_upper_position, self.helper_theta.size)
-        pts = np.vstack((self.helper_spring_x, self.helper_spring_y, zs)).T
-        new_wire = make_rectangular_spring_wire(pts, self.helper_wire_width, self.helper_wire_height)
-        self.helper_spring_mesh.setMeshData(meshdata=new_wire)
-
-        # Move the damper shaft
-        shaft_center = self.shaft_upper_position - self.shaft_length/2
-        self.shaft_mesh.resetTransform()
-        self.shaft_mesh.translate(0, 0, shaft_center)
-
-        # Move upper spring perch
-        self.upper_perch.resetTransform()
-        self.upper_perch.translate(0, 0, self.shaft_upper_position + 2.5) # TODO: add inputs for perch geometries
-        self.upper_cone.resetTransform()
-        self.upper_cone.translate(0, 0, (self.shaft_upper_position - self.damper_free_length))
-
-        # Move helper perch
-        self.helper_perch.resetTransform()
-        self.helper_perch.translate(0, 0, self.helper_perch_position)
-
         # Update overlay text
         ride_travel = getattr(self, "ride_height_travel", 0.0)
         ride_force = getattr(self, "ride_height_force", 0.0)
         rebound_avail = getattr(self, "rebound_available", 0.0)
         heave_avail = getattr(self, "heave_available", 0.0)
+        interference = getattr(self, "interference", None)
+        if interference is None:
+            interference_text = "none"
+        else:
+            (part_a, part_b), interference_travel = interference
+            interference_text = f"{part_a.replace('_', ' ')} / {part_b.replace('_', ' ')} at {interference_travel:.1f} mm travel"
 
         self.info_label.setText(
-            f"Coilover length: {self.shaft_upper_position:.1f} mm\n"
+            f"Coilover length: {state['shaft_upper_position']:.1f} mm\n"
             f"Available travel: {available_length:.1f} mm\n"
             f"Main Spring length: {spring_length:.1f} mm\n"
             f"Helper Spring length: {helper_spring_length:.1f} mm\n"
@@ -1139,6 +1135,7 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
             f"Ride height spring force: {ride_force:.1f} N\n"
             f"Max Rebound Travel: {rebound_avail:.1f} mm\n"
             f"Max Heave Travel: {heave_avail:.1f} mm\n"
+            f"Interference: {interference_text}\n"
         )
         self.info_label.adjustSize()
 
@@ -1154,12 +1151,43 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
     def animate(self, t):
         """
         t = 0 to 100 slider: moves spring + shaft
+        t may be fractional during playback.
         """
-        f = t / 100
-        state = self.compute_state(f)
+        if self.model is None:
+            return  # no scene yet
+        self.animated_step = t
+        if self.keyframes is not None:
+            state = scene_builders.keyframe_state(self.keyframes, t)
+        else:
+            state = self.model.compute_state(t / 100)
         self.apply_state(state)
         self.update_force_marker(state)
 
+    def show_playback_position(self, position):
+        """
+        Show one playback frame; the slider follows without requesting a step.
+        """
+        self.slider.blockSignals(True)
+        self.slider.setValue(round(position))
+        self.slider.blockSignals(False)
+        self.animate(position)
+
+    def on_playing_changed(self, playing):
+        self.play_btn.setText("Pause" if playing else "Play")
+        if playing and self.view is not None:
+            self.update_playback_overlay()
+            self.playback_label.show()
+
+    def update_playback_overlay(self):
+        """
+        Refresh the frame time / FPS / dropped frames overlay.
+        """
+        if self.view is None:
+            return
+        self.playback_label.setText(self.playback.stats.summary())
+        self.playback_label.adjustSize()
+        self.playback_label.move(10, self.view.height() - self.playback_label.height() - 10)
+
     def get_project_state(self):
         """
         Capture the current UI state for saving.
@@ -1278,8 +1306,11 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
         self.slider.setValue(int(state.get("slider", self.slider.value())))
         self.slider.blockSignals(False)
         self._loading_state = False
-        self.update_view()
-        self.mark_dirty()
+        # draw the loaded project now, in one recompute; its result is
+        # applied right away instead of when the worker's signal arrives
+        self.scheduler.request_update(dirty=True)
+        self.scheduler.flush()
+        self.finish_scene_update()
 
     def _ensure_sus_extension(self, path):
         return path if path.lower().endswith(".sus") else f"{path}.sus"
@@ -1293,6 +1324,7 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
         elevation = self.initial_camera.get("elevation", self.view.opts.get("elevation"))
         azimuth = self.initial_camera.get("azimuth", self.view.opts.get("azimuth"))
         self.view.setCameraPosition(distance=distance, elevation=elevation, azimuth=azimuth)
+        self.refresh_lod()
 
     def _write_project_file(self, path):
         data = self.get_project_state()
@@ -1337,6 +1369,37 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
             return
         self.load_project_from_path(path)
 
+    def open_spring_catalog(self):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self,
+            "Load Spring Catalog",
+            "",
+            "Spring Catalog (*.csv *.json);;All Files (*)",
+        )
+        if not path:
+            return
+        self.load_spring_catalog(path)
+
+    def load_spring_catalog(self, path, unit=None, quiet=False):
+        """
+        Load a catalog file, read in unit (default: the units currently shown
+        in the UI). The catalog is remembered and reloaded on the next start.
+        """
+        unit = unit or self.unit
+        try:
+            catalog = load_catalog(path, unit=unit)
+        except (OSError, ValueError) as exc:
+            if not quiet:
+                QtWidgets.QMessageBox.critical(self, "Open Failed", f"Could not load spring catalog:\n{exc}")
+            return
+
+        self.settings.setValue("spring_catalog/path", path)
+        self.settings.setValue("spring_catalog/unit", unit)
+        self.spring_catalog = catalog
+        self.catalog_query = None
+        self.q_spring_catalog.setEnabled(True)
+        self.refresh_spring_catalog()
+
     def load_project_from_path(self, path):
         try:
             with open(path, "r", encoding="utf-8") as f:
@@ -1391,8 +1454,61 @@ class CoiloverDesigner(QtWidgets.QMainWindow):
         else:
             event.ignore()
 
+class FirstPaintTimer(QtCore.QObject):
+    """
+    Event filter recording when a widget is first painted.
+    """
+
+    def __init__(self, widget):
+        super().__init__(widget)
+        self.time = None
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if self.time is None and event.type() == QtCore.QEvent.Paint:
+            self.time = time.perf_counter()
+            obj.removeEventFilter(self)
+        return False
+
+def run_startup_benchmark(app, max_first_paint_ms):
+    """
+    Open the window, print the import time, time to first paint and time
+    until the 3D scene is drawn (all from the start of this module), then
+    quit. Returns 1 when first paint took longer than max_first_paint_ms.
+    """
+    win = CoiloverDesigner()
+    first_paint = FirstPaintTimer(win)
+    result = {}
+
+    def scene_ready():
+        result["scene"] = time.perf_counter()
+        # let the scene paint before quitting
+        QtCore.QTimer.singleShot(0, app.quit)
+
+    win.sceneReady.connect(scene_ready)
+    win.show()
+    app.exec_()
+
+    first_paint_ms = ((first_paint.time or result["scene"]) - _start_time) * 1000
+    print(f"import: {_import_time * 1000:.0f} ms")
+    print(f"first paint: {first_paint_ms:.0f} ms")
+    print(f"3D scene ready: {(result['scene'] - _start_time) * 1000:.0f} ms")
+    if max_first_paint_ms is not None and first_paint_ms > max_first_paint_ms:
+        print(f"first paint is slower than {max_first_paint_ms:.0f} ms")
+        return 1
+    return 0
+
 if __name__ == "__main__":
-    app = QtWidgets.QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Coilover Tool")
+    parser.add_argument("--startup-benchmark", action="store_true", help="report startup times and exit")
+    parser.add_argument("--max-first-paint-ms", type=float, default=None,
+                        help="with --startup-benchmark, exit with status 1 if first paint is slower than this")
+    args, qt_args = parser.parse_known_args()
+
+    app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
+    if args.startup_benchmark:
+        sys.exit(run_startup_benchmark(app, args.max_first_paint_ms))
+
     win = CoiloverDesigner()
     win.show()
     sys.exit(app.exec_())
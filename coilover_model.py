@@ -0,0 +1,356 @@
+import json
+
+import numpy as np
+
+from physics_utils import *
+
+# unit conversions to the model's mm / N/mm / kg
+MM_PER_INCH = 25.4
+LBF_IN_PER_N_MM = 5.710147162769185
+KG_PER_LB = 0.45359237
+G = 9.80665
+
+CORNERS = ("front_left", "front_right", "rear_left", "rear_right")
+CORNER_NAMES = {
+    "Front Left": "front_left",
+    "Front Right": "front_right",
+    "Rear Left": "rear_left",
+    "Rear Right": "rear_right",
+}
+
+# Default inputs, matching the designer's fields (mm, N/mm, kg)
+DEFAULT_INPUTS = {
+    "spring_id": 63.5,
+    "spring_wire_diameter": 9.6,
+    "spring_free_length": 101.6,
+    "spring_rate": 70.04,
+    "spring_bind_length": 33.83,
+    "damper_free_length": 400,
+    "damper_comp_length": 250,
+    "damper_body_length": 200,
+    "damper_body_diameter": 50,
+    "damper_shaft_diameter": 20,
+    "body_threaded_length": 100,
+    "helper_outer_diameter": 85,
+    "helper_inner_diameter": 64,
+    "helper_thickness": 2.5,
+    "helper_inner_height": 13,
+    "helper_spring_id": 57.15,
+    "helper_spring_od": 73.91,
+    "helper_spring_free_length": 101.6,
+    "helper_spring_rate": 2.63,
+    "helper_spring_bind_length": 11.18,
+    "bump_height": 25,
+    "bump_diameter": 50,
+    "bump_rate": 50,
+    "lower_perch_outer_diameter": 87,
+    "lower_perch_thickness": 13,
+    "lower_perch_sleeve_height": 56,
+    "lower_perch_sleeve_inner_diameter": 52,
+    "upper_perch_outer_diameter": 85,
+    "upper_perch_thickness": 10,
+    "upper_perch_tapered_height": 10,
+    "lower_perch_position": 10,
+    "corner_weight_front_left": 295,
+    "corner_weight_front_right": 295,
+    "corner_weight_rear_left": 272,
+    "corner_weight_rear_right": 272,
+    "unsprung_weight_front_left": 36,
+    "unsprung_weight_front_right": 36,
+    "unsprung_weight_rear_left": 32,
+    "unsprung_weight_rear_right": 32,
+    "motion_ratio_front_left": 1.0,
+    "motion_ratio_front_right": 1.0,
+    "motion_ratio_rear_left": 1.0,
+    "motion_ratio_rear_right": 1.0,
+}
+
+RATE_INPUTS = ("spring_rate", "helper_spring_rate", "bump_rate")
+WEIGHT_INPUTS = tuple(f"{kind}_weight_{corner}" for kind in ("corner", "unsprung") for corner in CORNERS)
+RATIO_INPUTS = tuple(f"motion_ratio_{corner}" for corner in CORNERS)
+LENGTH_INPUTS = tuple(name for name in DEFAULT_INPUTS if name not in RATE_INPUTS + WEIGHT_INPUTS + RATIO_INPUTS)
+# inputs that change the coilover geometry or its travel states
+COILOVER_INPUTS = LENGTH_INPUTS + RATE_INPUTS
+
+# Fields of a travel state, see CoiloverModel.compute_states
+STATE_DTYPE = np.dtype([(name, np.float64) for name in (
+    "min_shaft_position",
+    "shaft_upper_position",
+    "available_length",
+    "spring_length",
+    "helper_spring_length",
+    "spring_force",
+    "spring_upper_position",
+    "helper_perch_position",
+    "helper_spring_lower_position",
+    "helper_spring_upper_position",
+    "travel",
+)])
+
+class CoiloverModel:
+    """
+    Travel and ride height model of a coilover, independent of the Qt window.
+
+    Inputs are plain numbers in mm, N/mm and kg keyed like the project file
+    inputs (see DEFAULT_INPUTS) and are available as attributes. Vehicle
+    inputs (corner/unsprung weights, motion ratios) may be None when unknown,
+    in which case no corner load is computed for that corner.
+    """
+
+    def __init__(self, inputs=None, corner="front_left", toggles=None):
+        values = dict(DEFAULT_INPUTS)
+        if inputs:
+            values.update(inputs)
+        self.inputs = values
+        for name, value in values.items():
+            setattr(self, name, value)
+        self.corner = corner
+        self.toggles = dict(toggles or {})
+        self.update_derived_geometry()
+
+    @classmethod
+    def from_project(cls, state):
+        """
+        Build a model from a project dict as saved in a .sus file.
+        Raises ValueError if the project isn't shaped like one or a coilover
+        input is not a number.
+        """
+        if not isinstance(state, dict):
+            raise ValueError("project is not a JSON object")
+        for key in ("inputs", "toggles"):
+            if not isinstance(state.get(key, {}), dict):
+                raise ValueError(f"project {key} is not a JSON object")
+
+        def number(name, text):
+            try:
+                return float(text)
+            except TypeError:
+                raise ValueError(f"{name} is not a number: {text!r}") from None
+
+        length_scale = MM_PER_INCH if state.get("unit", "mm") == "in" else 1.0
+        rate_scale = 1 / LBF_IN_PER_N_MM if state.get("unit", "mm") == "in" else 1.0
+        weight_scale = KG_PER_LB if state.get("weight_unit", "kg") == "lb" else 1.0
+
+        inputs = {}
+        for name, text in state.get("inputs", {}).items():
+            if name not in DEFAULT_INPUTS:
+                continue
+            if name in WEIGHT_INPUTS or name in RATIO_INPUTS:
+                try:
+                    value = float(text)
+                except (TypeError, ValueError):
+                    inputs[name] = None
+                    continue
+                inputs[name] = value * weight_scale if name in WEIGHT_INPUTS else value
+            elif name in RATE_INPUTS:
+                inputs[name] = number(name, text) * rate_scale
+            else:
+                inputs[name] = number(name, text) * length_scale
+
+        corner = state.get("corner")
+        corner = CORNER_NAMES.get(corner, "front_left") if isinstance(corner, str) else "front_left"
+        return cls(inputs, corner=corner, toggles=state.get("toggles"))
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Load a .sus project file into a model.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_project(json.load(f))
+
+    def update_derived_geometry(self):
+        """
+        Positions and wire dimensions derived from the inputs.
+        """
+        self.helper_perch_thickness = self.helper_thickness
+        self.shaft_length = self.damper_comp_length #TODO fix this simplificiation
+
+        # Main spring
+        self.spring_bottom_position = self.damper_body_length + self.lower_perch_position + self.spring_wire_diameter / 2 # Z coordinate where the bottom spring wire's center sits
+        self.spring_upper_position = self.spring_bottom_position + self.spring_free_length - self.spring_wire_diameter # Z coordinate where the top spring wire's center sits
+
+        # Helper spring
+        self.helper_wire_width = (self.helper_outer_diameter - self.helper_inner_diameter) / 2
+        self.helper_coils, self.helper_wire_height = calculate_active_coils_rectangular(
+            spring_rate=self.helper_spring_rate,
+            inner_diameter=self.helper_inner_diameter,
+            outer_diameter=self.helper_outer_diameter,
+            shear_modulus=80e3,
+            wire_width=self.helper_wire_width,
+            solid_height=self.helper_spring_bind_length
+        )
+        self.helper_spring_lower_position = self.spring_upper_position + self.spring_wire_diameter / 2 + self.helper_perch_thickness + self.helper_wire_height / 2 # Z coordinate where the bottom spring wire's center sits
+        self.helper_spring_upper_position = self.helper_spring_lower_position + self.helper_spring_free_length - self.helper_wire_height # Z coordinate where the top spring wire's center sits
+
+        # Travel from full droop until both springs reach bind
+        self.max_travel = self.damper_free_length - (self.spring_bottom_position - self.spring_wire_diameter / 2) - self.helper_perch_thickness - self.spring_bind_length - self.helper_spring_bind_length
+
+    def compute_states(self, fractions):
+        """
+        Calculate geometry and force states for an array of normalized travel
+        fractions (0–1) in one pass.
+        Returns a structured array (STATE_DTYPE) shaped like fractions.
+
+        Inputs may also be arrays (e.g. one row per design in a parameter
+        sweep); they broadcast against fractions and shape the result.
+        """
+        f = np.asarray(fractions, dtype=float)
+
+        min_shaft_position = np.maximum(
+            self.damper_comp_length,
+            (self.spring_bottom_position - self.spring_wire_diameter / 2 + self.spring_bind_length + self.helper_spring_bind_length + self.helper_perch_thickness)
+        )
+
+        shaft_upper_position = self.damper_free_length - (self.damper_free_length - min_shaft_position) * f
+
+        # available_length: this not the available travel
+        available_spring_length = shaft_upper_position - (self.spring_bottom_position - self.spring_wire_diameter / 2) - self.helper_perch_thickness
+
+        available_length = available_spring_length - self.spring_bind_length - self.helper_spring_bind_length
+
+        spring_length, helper_spring_length, spring_force = split_strut_length_to_springs(
+            self.spring_rate,
+            self.helper_spring_rate,
+            available_spring_length,
+            self.spring_bind_length,
+            self.helper_spring_bind_length,
+            self.spring_free_length,
+            self.helper_spring_free_length
+        )
+
+        spring_upper_position = self.spring_bottom_position + (spring_length - self.spring_wire_diameter)
+        helper_perch_position = spring_upper_position + self.spring_wire_diameter / 2 + self.helper_perch_thickness / 2
+        helper_spring_lower_position = helper_perch_position + self.helper_perch_thickness / 2 + self.helper_wire_height / 2
+        helper_spring_upper_position = helper_spring_lower_position + (helper_spring_length - self.helper_wire_height)
+
+        travel = self.damper_free_length - shaft_upper_position
+
+        states = np.empty(np.shape(spring_force), dtype=STATE_DTYPE)
+        states["min_shaft_position"] = min_shaft_position
+        states["shaft_upper_position"] = shaft_upper_position
+        states["available_length"] = available_length
+        states["spring_length"] = spring_length
+        states["helper_spring_length"] = helper_spring_length
+        states["spring_force"] = spring_force
+        states["spring_upper_position"] = spring_upper_position
+        states["helper_perch_position"] = helper_perch_position
+        states["helper_spring_lower_position"] = helper_spring_lower_position
+        states["helper_spring_upper_position"] = helper_spring_upper_position
+        states["travel"] = travel
+        return states
+
+    def compute_state(self, f):
+        """
+        Calculate geometry and force state for a normalized travel fraction f (0–1).
+        Returns a single STATE_DTYPE record, indexed by field name.
+        """
+        return self.compute_states(np.array([f]))[0]
+
+    def compute_force_curve(self, samples=150):
+        """
+        Spring force across the full travel.
+        Returns (travel_vals, force_vals) arrays.
+        """
+        states = self.compute_states(np.linspace(0, 1, samples))
+        return states["travel"], states["spring_force"]
+
+    def compute_corner_load(self, corner=None):
+        """
+        Return the target coilover force for a corner (default: the model's
+        selected corner), or None if its vehicle inputs are unknown.
+        """
+        corner = corner or self.corner
+        corner_mass = getattr(self, f"corner_weight_{corner}")
+        unsprung_mass = getattr(self, f"unsprung_weight_{corner}")
+        motion_ratio = getattr(self, f"motion_ratio_{corner}")
+        if corner_mass is None or unsprung_mass is None or motion_ratio is None:
+            return None
+
+        motion_ratio = max(motion_ratio, 0.0)
+        sprung_mass = max(corner_mass - unsprung_mass, 0.0)
+        sprung_force = sprung_mass * G  # N at the wheel
+        coilover_force = sprung_force * motion_ratio
+
+        return {
+            "corner_mass": corner_mass,
+            "unsprung_mass": unsprung_mass,
+            "motion_ratio": motion_ratio,
+            "sprung_force": sprung_force,
+            "coilover_force": coilover_force,
+        }
+
+    def compute_corner_loads(self, corners=CORNERS):
+        """
+        Target coilover force for several corners at once, as an array in the
+        order of corners. Corners with unknown vehicle inputs are nan.
+        """
+        def column(kind):
+            values = [getattr(self, f"{kind}_{corner}") for corner in corners]
+            return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+        corner_mass = column("corner_weight")
+        unsprung_mass = column("unsprung_weight")
+        motion_ratio = np.maximum(column("motion_ratio"), 0.0)
+        sprung_mass = np.maximum(corner_mass - unsprung_mass, 0.0)
+        return sprung_mass * G * motion_ratio
+
+    def compute_ride_heights(self, travel_vals, force_vals, corners=CORNERS):
+        """
+        Ride height for several corners in one pass. Returns a dict of arrays
+        in the order of corners; corners without a load sit at full droop.
+        """
+        n = len(corners)
+        if travel_vals.size == 0 or force_vals.size == 0:
+            zeros = np.zeros(n)
+            return {"ride_height_position": zeros, "force": zeros, "rebound_travel": zeros, "heave_travel": zeros}
+
+        target_force = np.maximum(self.compute_corner_loads(corners), 0.0)
+        known = ~np.isnan(target_force)
+        target_force = np.where(known, target_force, force_vals[0])
+
+        ride_pos = np.interp(target_force, force_vals, travel_vals)
+        force = target_force.copy()
+        below = target_force <= force_vals[0]
+        above = target_force >= force_vals[-1]
+        ride_pos[below], force[below] = travel_vals[0], force_vals[0]
+        ride_pos[above], force[above] = travel_vals[-1], force_vals[-1]
+
+        rebound_travel = ride_pos # the amount the damper compresses at ride height is the maximum possible rebound travel
+        heave_travel = self.max_travel - rebound_travel
+
+        return {
+            "ride_height_position": ride_pos,
+            "force": force,
+            "rebound_travel": rebound_travel,
+            "heave_travel": heave_travel,
+        }
+
+    def compute_ride_height(self, travel_vals, force_vals, corner=None):
+        """
+        Calculate ride height position where spring force balances corner load.
+        """
+        ride_state = self.compute_ride_heights(travel_vals, force_vals, (corner or self.corner,))
+        return {key: float(values[0]) for key, values in ride_state.items()}
+
+    def compute_corner_summary(self, corner=None, samples=150):
+        """
+        Ride height, travel ranges and bind margins for a corner (default: the
+        model's selected corner). Bind margins are how much each spring can
+        still compress at ride height before it reaches bind.
+        """
+        travel_vals, force_vals = self.compute_force_curve(samples)
+        ride_state = self.compute_ride_height(travel_vals, force_vals, corner)
+        corner_load = self.compute_corner_load(corner)
+
+        total_travel = float(travel_vals[-1]) if travel_vals.size else 0.0
+        f = ride_state["ride_height_position"] / total_travel if total_travel > 0 else 0.0
+        state = self.compute_state(f)
+
+        return {
+            "corner": corner or self.corner,
+            "corner_load": corner_load["coilover_force"] if corner_load else None,
+            **ride_state,
+            "spring_bind_margin": float(state["spring_length"] - self.spring_bind_length),
+            "helper_bind_margin": float(state["helper_spring_length"] - self.helper_spring_bind_length),
+        }
@@ -1,100 +1,256 @@
+from functools import lru_cache
+
 import numpy as np
 import pyqtgraph.opengl as gl
-from physics_utils import compute_frames
+from OpenGL import GL
+from pyqtgraph.opengl import shaders
+from pyqtgraph.Qt import QtGui
+from physics_utils import compute_frames, compute_tangents
 
-def make_cylinder(radius, length, sectors):
+# number of (n_points, n_sides) face topologies kept for swept meshes
+SWEEP_TOPOLOGY_CACHE_SIZE = 16
+# number of distinct cylinders, rings and cones kept for reuse
+PRIMITIVE_CACHE_SIZE = 32
+
+# Level-of-detail steps, coarse to fine. helix_lod and circle_lod pick the
+# first step whose edges come out at most LOD_EDGE_PX long on screen.
+LOD_SAMPLES_PER_COIL = (6, 8, 12, 16, 24, 32)
+LOD_WIRE_SIDES = (4, 6, 8, 12)
+LOD_SECTORS = (16, 24, 32, 48, 64)
+LOD_EDGE_PX = 4.0
+# steps dropped while the view is being dragged
+LOD_COARSE_STEPS = 2
+
+def _quad_triangles(*triangles):
     """
-    Returns a MeshData cylinder aligned along z.
+    Stacks triangles given as (i, j, k) tuples of index arrays so the
+    triangles built for the same quad stay adjacent in the face list.
     """
-    theta = np.linspace(0, 2*np.pi, sectors, endpoint=False)
-    xs, ys = np.cos(theta)*radius, np.sin(theta)*radius
-    # top and bottom circles
-    top    = np.vstack([xs, ys, np.full_like(xs, length/2)]).T
-    bottom = np.vstack([xs, ys, np.full_like(xs, -length/2)]).T
-    top_center = np.array([[0.0, 0.0,  length/2]])
-    bot_center = np.array([[0.0, 0.0, -length/2]])
+    return np.stack([np.stack(tri, axis=-1) for tri in triangles], axis=1).reshape(-1, 3)
 
-    verts = np.vstack([top, bottom, top_center, bot_center])
-    faces = []
+def _mesh_with_normals(verts, faces, normals, **kwargs):
+    """
+    Wraps vertexes, faces and their vertex normals in a MeshData; kwargs go
+    to MeshData.
+    MeshData has no public setter for normals, so this seeds its private
+    _vertexNormals cache, which vertexNormals() returns instead of averaging
+    the face normals (checked against pyqtgraph 0.14). GLMeshItem only calls
+    vertexNormals() when built with computeNormals=True and smooth=True;
+    without them the seeded normals are ignored. This is the only place the
+    cache is written; recheck it when upgrading pyqtgraph.
+    """
+    mesh = gl.MeshData(vertexes=verts, faces=faces, **kwargs)
+    mesh._vertexNormals = normals
+    return mesh
 
-    # side faces
-    for i in range(sectors):
-        n = (i + 1) % sectors
-        faces.append([i, n, sectors + i])
-        faces.append([n, sectors + n, sectors + i])
+def _ring(radius, z, cos, sin):
+    return np.column_stack([radius*cos, radius*sin, np.full(len(cos), z)])
 
-    top_c_idx = 2 * sectors
-    bot_c_idx = 2 * sectors + 1
+def _wall(radius, z0, z1, cos, sin, inward):
+    """
+    Side wall between two rings: vertexes (bottom ring, then top ring),
+    their normals and the faces, wound to match the normals. The normals
+    point into the solid, so inward=True for a wall facing away from the axis.
+    """
+    sectors = len(cos)
+    verts = np.vstack([_ring(radius, z0, cos, sin), _ring(radius, z1, cos, sin)])
+    radial = np.column_stack([cos, sin, np.zeros(sectors)])
+    normals = np.vstack([radial, radial]) * (-1 if inward else 1)
+    i = np.arange(sectors)
+    n = (i + 1) % sectors
+    if inward:
+        faces = _quad_triangles((i, sectors + i, n), (n, sectors + i, sectors + n))
+    else:
+        faces = _quad_triangles((i, n, sectors + i), (n, sectors + n, sectors + i))
+    return verts, normals, faces
 
-    # top cap (normals point +Z)
-    for i in range(sectors):
-        n = (i + 1) % sectors
-        faces.append([top_c_idx, i, n])
+def _cap(outer_r, inner_r, z, cos, sin, facing_up):
+    """
+    Flat disc (inner_r=0) or ring at height z with its own vertexes and
+    normals pointing into the solid (down for a top face, facing_up=False).
+    """
+    sectors = len(cos)
+    i = np.arange(sectors)
+    n = (i + 1) % sectors
+    if inner_r == 0:
+        verts = np.vstack([_ring(outer_r, z, cos, sin), [[0.0, 0.0, z]]])
+        center = np.full(sectors, sectors)
+        faces = np.column_stack([center, i, n]) if facing_up else np.column_stack([center, n, i])
+    else:
+        verts = np.vstack([_ring(outer_r, z, cos, sin), _ring(inner_r, z, cos, sin)])
+        if facing_up:
+            faces = _quad_triangles((i, n, sectors + i), (n, sectors + n, sectors + i))
+        else:
+            faces = _quad_triangles((i, sectors + i, n), (n, sectors + i, sectors + n))
+    normals = np.tile([0.0, 0.0, 1.0 if facing_up else -1.0], (len(verts), 1))
+    return verts, normals, faces
 
-    # bottom cap (normals point -Z)
-    for i in range(sectors):
-        n = (i + 1) % sectors
-        faces.append([bot_c_idx, sectors + n, sectors + i])
+def _assemble(parts):
+    """
+    Joins (verts, normals, faces) parts into one MeshData.
+    """
+    verts, normals, faces = [], [], []
+    offset = 0
+    for part_verts, part_normals, part_faces in parts:
+        verts.append(part_verts)
+        normals.append(part_normals)
+        faces.append(part_faces + offset)
+        offset += len(part_verts)
+    return _mesh_with_normals(
+        np.vstack(verts).astype(np.float32),
+        np.vstack(faces).astype(np.uint32),
+        np.vstack(normals).astype(np.float32),
+    )
+
+# Primitive normals are exact and point into the solid, like the sweeps
+# below (that is the side pyqtgraph's "shaded" program lights from the
+# camera). Vertexes on the rim between a wall and a cap are duplicated so
+# each face keeps its own normal instead of one smoothed across the edge.
 
-    return gl.MeshData(vertexes=verts, faces=np.array(faces))
+@lru_cache(maxsize=PRIMITIVE_CACHE_SIZE)
+def make_cylinder(radius, length, sectors):
+    """
+    Returns a MeshData cylinder aligned along z.
+    Results are cached by (radius, length, sectors) and shared, so the
+    returned MeshData must not be modified.
+    """
+    theta = np.linspace(0, 2*np.pi, sectors, endpoint=False)
+    cos, sin = np.cos(theta), np.sin(theta)
+    return _assemble([
+        _wall(radius, -length/2, length/2, cos, sin, inward=True),
+        _cap(radius, 0, length/2, cos, sin, facing_up=False),    # top
+        _cap(radius, 0, -length/2, cos, sin, facing_up=True),    # bottom
+    ])
 
+@lru_cache(maxsize=PRIMITIVE_CACHE_SIZE)
 def make_annular_cylinder(outer_r, inner_r, height, sectors=32):
         """
         Returns a MeshData for a flat ring (outer radius outer_r, inner radius inner_r)
         of thickness `height` centered on z=0.
+        Results are cached by (outer_r, inner_r, height, sectors) and shared, so
+        the returned MeshData must not be modified.
         """
-        # angles for your circle
-        theta = np.linspace(0, 2*np.pi, sectors, endpoint=False)
-        cos, sin = np.cos(theta), np.sin(theta)
-
-        # top & bottom rings: outer & inner
-        top_outer    = np.column_stack([outer_r*cos,        outer_r*sin,        np.full(sectors,  height/2)])
-        bot_outer    = np.column_stack([outer_r*cos,        outer_r*sin,        np.full(sectors, -height/2)])
-        top_inner    = np.column_stack([inner_r*cos,        inner_r*sin,        np.full(sectors,  height/2)])
-        bot_inner    = np.column_stack([inner_r*cos,        inner_r*sin,        np.full(sectors, -height/2)])
-
-        verts = np.vstack([top_outer, bot_outer, top_inner, bot_inner])
-        faces = []
-
-        # helper to index sections
-        O  = 0
-        B  = sectors
-        I  = 2*sectors
-        BI = 3*sectors
-
-        # outer wall
-        for i in range(sectors):
-            a = O + i
-            b = O + (i+1)%sectors
-            c = B + i
-            d = B + (i+1)%sectors
-            faces += [[a, c, b], [b, c, d]]
-
-        # inner wall (flip winding so normals point inward)
-        for i in range(sectors):
-            a = I + i
-            b = I + (i+1)%sectors
-            c = BI + i
-            d = BI + (i+1)%sectors
-            faces += [[c, a, b], [b, d, c]]
-
-        # top face (between outer & inner)
-        for i in range(sectors):
-            a = O + i
-            b = O + (i+1)%sectors
-            c = I + i
-            d = I + (i+1)%sectors
-            faces += [[a, b, c], [b, d, c]]
-
-        # bottom face
-        for i in range(sectors):
-            a = B + i
-            b = B + (i+1)%sectors
-            c = BI + i
-            d = BI + (i+1)%sectors
-            faces += [[b, a, c], [a, d, c]]
-
-        return gl.MeshData(vertexes=verts, faces=np.array(faces))
+        return _assemble(_annulus_parts(outer_r, inner_r, -height/2, height/2, sectors))
+
+def _annulus_parts(outer_r, inner_r, z0, z1, sectors):
+    theta = np.linspace(0, 2*np.pi, sectors, endpoint=False)
+    cos, sin = np.cos(theta), np.sin(theta)
+    return [
+        _wall(outer_r, z0, z1, cos, sin, inward=True),
+        _wall(inner_r, z0, z1, cos, sin, inward=False),
+        _cap(outer_r, inner_r, z1, cos, sin, facing_up=False),   # top
+        _cap(outer_r, inner_r, z0, cos, sin, facing_up=True),    # bottom
+    ]
+
+@lru_cache(maxsize=PRIMITIVE_CACHE_SIZE)
+def make_stepped_annulus(outer_r, step_r, inner_r, thickness, step_height, sectors=64):
+    """
+    Returns a MeshData for two concentric rings: a flat ring from outer_r
+    to step_r of the given thickness, centered on z=0, and an inner ring
+    from step_r to inner_r of height step_height rising from the flat
+    ring's bottom face (e.g. the helper perch, whose step locates the
+    helper spring above it).
+    Cached and shared like the other primitives.
+    """
+    return _assemble(
+        _annulus_parts(outer_r, step_r, -thickness/2, thickness/2, sectors)
+        + _annulus_parts(step_r, inner_r, -thickness/2, step_height - thickness/2, sectors)
+    )
+
+@lru_cache(maxsize=PRIMITIVE_CACHE_SIZE)
+def make_cone(radius, height, sectors=32):
+    """
+    Returns a MeshData cone with its base ring on z=0 and its tip at z=height.
+    Cached and shared like the other primitives.
+    """
+    angles = np.linspace(0, 2*np.pi, sectors, endpoint=False)
+    base = _ring(radius, 0.0, np.cos(angles), np.sin(angles))
+    # one tip vertex per face, with the normal halfway round it, so the
+    # surface is shaded smoothly up to the tip
+    mid = angles + np.pi / sectors
+    tips = np.tile([0.0, 0.0, height], (sectors, 1))
+
+    def side_normals(a):
+        n = np.column_stack([height*np.cos(a), height*np.sin(a), np.full(len(a), radius)])
+        return -n / np.linalg.norm(n, axis=1, keepdims=True)
+
+    i = np.arange(sectors)
+    faces = np.column_stack([i, sectors + i, (i + 1) % sectors])
+    return _assemble([(np.vstack([base, tips]), np.vstack([side_normals(angles), side_normals(mid)]), faces)])
+
+@lru_cache(maxsize=SWEEP_TOPOLOGY_CACHE_SIZE)
+def _sweep_faces(n_points, n_sides):
+    """
+    Triangle indices joining consecutive rings of a swept cross-section.
+    Ring i occupies vertices [i*n_sides, (i+1)*n_sides).
+    The topology only depends on (n_points, n_sides), so results are cached
+    and shared between meshes; the returned array is read-only.
+    returns: (2*(n_points-1)*n_sides, 3) uint32 array
+    """
+    ring = np.arange(n_sides)
+    base = (np.arange(n_points - 1) * n_sides)[:, None]
+    a = base + ring
+    b = base + (ring + 1) % n_sides
+    c = a + n_sides
+    d = b + n_sides
+    # two triangles (a, c, b) and (b, c, d) per quad, same order as ring-by-ring construction
+    faces = np.stack([np.stack([a, c, b], axis=-1), np.stack([b, c, d], axis=-1)], axis=2)
+    faces = np.ascontiguousarray(faces.reshape(-1, 3), dtype=np.uint32)
+    faces.flags.writeable = False
+    return faces
+
+@lru_cache(maxsize=SWEEP_TOPOLOGY_CACHE_SIZE)
+def _flat_sweep_faces(n_points, n_faces):
+    """
+    Triangle indices for a sweep of a polygon with its own vertex pair per
+    edge (rings of 2*n_faces vertexes, see _rectangular_profile): the
+    quads of _sweep_faces between the two vertexes of each edge, skipping
+    the empty ones between an edge and the next. Cached and read-only.
+    """
+    faces = _sweep_faces(n_points, 2 * n_faces).reshape(n_points - 1, n_faces, 2, 2, 3)[:, :, 0]
+    faces = np.ascontiguousarray(faces.reshape(-1, 3))
+    faces.flags.writeable = False
+    return faces
+
+def _sweep(path_pts, u_axes, v_axes, profile, verts=None, normals=None, profile_normals=None):
+    """
+    Places a 2D cross-section at every path point.
+    path_pts: (N,3) centerline points
+    u_axes, v_axes: (N,3) orthonormal section axes at each point
+    profile: (S,2) section coordinates along (u, v), measured from the centerline
+    verts, normals: optional (N*S,3) float32 buffers written in place
+    profile_normals: optional (S,2) outward unit normals of the section at
+    the profile points; by default they are radial to the centerline
+    (exact for a round tube)
+    returns: (verts, normals), ring by ring; normals point inward to match
+    the face winding, i.e. the same side MeshData would compute from the faces
+    """
+    n_points, n_sides = len(path_pts), len(profile)
+    if verts is None:
+        verts = np.empty((n_points * n_sides, 3), dtype=np.float32)
+    if normals is None:
+        normals = np.empty((n_points * n_sides, 3), dtype=np.float32)
+    if profile_normals is None:
+        profile_normals = profile / np.linalg.norm(profile, axis=1)[:, None]
+
+    v3 = verts.reshape(n_points, n_sides, 3)
+    n3 = normals.reshape(n_points, n_sides, 3)
+    np.multiply(u_axes[:, None, :], profile[None, :, 0, None], out=v3)
+    v3 += v_axes[:, None, :] * profile[None, :, 1, None]
+    v3 += path_pts[:, None, :]
+    np.multiply(u_axes[:, None, :], -profile_normals[None, :, 0, None], out=n3)
+    n3 -= v_axes[:, None, :] * profile_normals[None, :, 1, None]
+    return verts, normals
+
+def _swept_mesh(verts, normals, n_points, n_sides):
+    """
+    Wraps swept vertex/normal buffers in a MeshData sharing the cached topology.
+    """
+    return _mesh_with_normals(verts, _sweep_faces(n_points, n_sides), normals)
+
+def _circle_profile(wire_radius, n_sides):
+    theta = np.linspace(0, 2*np.pi, n_sides, endpoint=False)
+    return np.column_stack([np.cos(theta), np.sin(theta)]) * wire_radius  # (S, 2)
 
 def make_spring_wire(path_pts, wire_radius, n_sides=8):
         """
@@ -104,33 +260,46 @@ def make_spring_wire(path_pts, wire_radius, n_sides=8):
         returns: MeshData for a tube
         """
         tangents, normals, binorms = compute_frames(path_pts)
-        
-        # Generate circle in local frames
-        theta = np.linspace(0, 2*np.pi, n_sides, endpoint=False)
-        circle = np.vstack([np.cos(theta), np.sin(theta)]) * wire_radius  # (2, S)
-        
-        verts = []
-        faces = []
-        for i, p in enumerate(path_pts):
-            # build ring i
-            for j in range(n_sides):
-                offset = normals[i]*circle[0,j] + binorms[i]*circle[1,j]
-                verts.append(p + offset)
-        verts = np.array(verts)  # (N * S, 3)
-        
-        # Build faces by connecting ring i to i+1
-        for i in range(len(path_pts) - 1):
-            for j in range(n_sides):
-                a = i*n_sides + j
-                b = i*n_sides + (j+1)%n_sides
-                c = (i+1)*n_sides + j
-                d = (i+1)*n_sides + (j+1)%n_sides
-                # two triangles (a, c, b) and (b, c, d)
-                faces.append([a, c, b])
-                faces.append([b, c, d])
-        
-        mesh = gl.MeshData(vertexes=verts, faces=np.array(faces))
-        return mesh
+        verts, vert_normals = _sweep(path_pts, normals, binorms, _circle_profile(wire_radius, n_sides))
+        return _swept_mesh(verts, vert_normals, len(path_pts), n_sides)
+
+def _rectangular_profile(wire_width, wire_height):
+    """
+    (profile, profile_normals) of a rectangular wire section in (radial,
+    vertical) coords: each edge has its own pair of corner points carrying
+    the edge's normal, so the faces of the swept box are shaded flat.
+    """
+    corners = np.array([
+        (+wire_width/2, +wire_height/2),
+        (-wire_width/2, +wire_height/2),
+        (-wire_width/2, -wire_height/2),
+        (+wire_width/2, -wire_height/2),
+    ])
+    edge_normals = np.array([(0.0, 1.0), (-1.0, 0.0), (0.0, -1.0), (1.0, 0.0)])  # top, inner, bottom, outer
+    return corners[[0, 1, 1, 2, 2, 3, 3, 0]], np.repeat(edge_normals, 2, axis=0)
+
+def _upright_section_axes(path_pts):
+    """
+    Radial and vertical section axes that keep a swept cross-section
+    upright (parallel to XY ground plane).
+    """
+    # we only need tangents; normals/binorms no longer used for section orientation
+    tangents = compute_tangents(path_pts)
+
+    # radial axis: perpendicular to both tangent and up, i.e. up × t
+    radial = np.column_stack([-tangents[:, 1], tangents[:, 0], np.zeros(len(tangents))])
+    norm_r = np.linalg.norm(radial, axis=1)
+    # tangent is nearly vertical → choose arbitrary horizontal axis
+    vertical_tangent = norm_r < 1e-6
+    radial[vertical_tangent] = (1.0, 0.0, 0.0)
+    norm_r[vertical_tangent] = 1.0
+    radial /= norm_r[:, None]
+
+    # vertical axis in the plane normal to tangent
+    vertical = np.cross(tangents, radial)
+    vertical /= np.linalg.norm(vertical, axis=1)[:, None]
+
+    return radial, vertical
 
 def make_rectangular_spring_wire(path_pts, wire_width, wire_height):
     """
@@ -142,54 +311,208 @@ def make_rectangular_spring_wire(path_pts, wire_width, wire_height):
     wire_height: height of the rectangular cross-section (vertical)
     returns: MeshData for a rectangular prism sweep
     """
-    # we only need tangents; normals/binorms no longer used for section orientation
-    tangents, _, _ = compute_frames(path_pts)
+    radial, vertical = _upright_section_axes(path_pts)
+    profile, profile_normals = _rectangular_profile(wire_width, wire_height)
+    verts, normals = _sweep(path_pts, radial, vertical, profile, profile_normals=profile_normals)
+    return _mesh_with_normals(verts, _flat_sweep_faces(len(path_pts), 4), normals)
 
-    # Predefine the 4 local corner offsets in (radial, vertical) coords
-    local_corners = [
-        (+wire_width/2, +wire_height/2),
-        (-wire_width/2, +wire_height/2),
-        (-wire_width/2, -wire_height/2),
-        (+wire_width/2, -wire_height/2),
-    ]
+def _lod_step(steps, edges, coarse):
+    i = int(np.searchsorted(steps, edges))
+    i = min(i, len(steps) - 1)
+    if coarse:
+        i = max(i - LOD_COARSE_STEPS, 0)
+    return steps[i]
 
-    verts = []
-    faces = []
-    global_up = np.array([0.0, 0.0, 1.0])
-
-    # Build vertices
-    for i, p in enumerate(path_pts):
-        t = tangents[i]
-        # radial axis: perpendicular to both tangent and up
-        r = np.cross(global_up, t)
-        norm_r = np.linalg.norm(r)
-        if norm_r < 1e-6:
-            # tangent is nearly vertical → choose arbitrary horizontal axis
-            r = np.array([1.0, 0.0, 0.0])
-        else:
-            r /= norm_r
-
-        # vertical axis in the plane normal to tangent
-        v = np.cross(t, r)
-        v /= np.linalg.norm(v)
-
-        # place each corner
-        for (wx, hy) in local_corners:
-            offset = r * wx + v * hy
-            verts.append(p + offset)
-
-    verts = np.array(verts)  # shape (N*4, 3)
-
-    # Build faces by connecting quads between successive sections
-    n_sections = len(path_pts)
-    for i in range(n_sections - 1):
-        for j in range(4):
-            a =  i*4 + j
-            b =  i*4 + (j + 1) % 4
-            c = (i+1)*4 + j
-            d = (i+1)*4 + (j + 1) % 4
-            # two triangles per quad
-            faces.append([a, c, b])
-            faces.append([b, c, d])
-
-    return gl.MeshData(vertexes=verts, faces=np.array(faces))
+def helix_lod(coils, coil_diameter, wire_size, pixels_per_mm=None, coarse=False):
+    """
+    (samples, n_sides) for a spring helix: path samples for the whole helix
+    and sides of a round wire, from the number of coils and how large the
+    coil and wire diameters (mm) appear on screen. pixels_per_mm=None
+    gives the finest level.
+    """
+    if pixels_per_mm is None:
+        per_coil, n_sides = LOD_SAMPLES_PER_COIL[-1], LOD_WIRE_SIDES[-1]
+    else:
+        per_coil = _lod_step(LOD_SAMPLES_PER_COIL, np.pi * coil_diameter * pixels_per_mm / LOD_EDGE_PX, coarse)
+        n_sides = _lod_step(LOD_WIRE_SIDES, np.pi * wire_size * pixels_per_mm / LOD_EDGE_PX, coarse)
+    return max(int(np.ceil(coils * per_coil)), 1) + 1, n_sides
+
+def circle_lod(diameter, pixels_per_mm=None, coarse=False):
+    """
+    Sectors for a round part of the given diameter (mm), like helix_lod.
+    """
+    if pixels_per_mm is None:
+        return LOD_SECTORS[-1]
+    return _lod_step(LOD_SECTORS, np.pi * diameter * pixels_per_mm / LOD_EDGE_PX, coarse)
+
+# pyqtgraph's "shaded" program, with each vertex moved along z by
+# SpringItem's stretch: a_center_z is the rest height of the vertex's
+# centerline point, which maps to u_stretch[0] * a_center_z + u_stretch[1].
+SPRING_STRETCH_SHADER = shaders.ShaderProgram("springStretch", [
+    shaders.VertexShader("""
+        uniform mat4 u_mvp;
+        uniform mat3 u_normal;
+        uniform float u_stretch[2];
+        attribute vec4 a_position;
+        attribute vec3 a_normal;
+        attribute vec4 a_color;
+        attribute float a_center_z;
+        varying vec4 v_color;
+        varying vec3 v_normal;
+        void main() {
+            v_normal = normalize(u_normal * a_normal);
+            v_color = a_color;
+            vec4 position = a_position;
+            position.z += (u_stretch[0] - 1.0) * a_center_z + u_stretch[1];
+            gl_Position = u_mvp * position;
+        }
+    """),
+    shaders.getShaderProgram("shaded").shaders[1],
+], uniforms={"u_stretch": [1.0, 0.0]})
+
+class SpringItem(gl.GLMeshItem):
+    """
+    GLMeshItem for a swept spring that is compressed on the GPU.
+
+    The rest-pose tube is uploaded once. setStretch(scale, offset) maps the
+    height z of each centerline point to scale * z + offset in the vertex
+    shader and moves that point's ring of vertexes with it unchanged, so the
+    wire keeps its cross-section (the rings keep their rest tilt, which for
+    the small pitch angles of a coil spring is not visible). Changing the
+    stretch uploads nothing, so animating costs the same at any resolution.
+
+    centerline_z: rest heights of the sweep's path points
+    """
+    def __init__(self, centerline_z, **kwds):
+        self.stretch = (1.0, 0.0)
+        kwds.setdefault("shader", SPRING_STRETCH_SHADER)
+        super().__init__(**kwds)
+        n_sides = len(self.opts["meshdata"].vertexes()) // len(centerline_z)
+        self.center_z = np.ascontiguousarray(np.repeat(centerline_z, n_sides), dtype=np.float32)
+        self.m_vbo_center_z = QtGui.QOpenGLBuffer(QtGui.QOpenGLBuffer.Type.VertexBuffer)
+
+    def setStretch(self, scale, offset):
+        self.stretch = (float(scale), float(offset))
+        self.update()
+
+    def paint(self):
+        shader = self.shader()
+        # the program is shared between springs, so load this item's stretch
+        shader["u_stretch"] = self.stretch
+        loc = _enable_float_attribute(shader, "a_center_z", self.m_vbo_center_z, self.center_z)
+        try:
+            super().paint()
+        finally:
+            if loc != -1:
+                GL.glDisableVertexAttribArray(loc)
+
+# pyqtgraph's "shaded" program, with each vertex moved along z by the
+# offset of its part: a_part indexes u_part_z (MERGED_MAX_PARTS entries).
+MERGED_MAX_PARTS = 8
+MERGED_PARTS_SHADER = shaders.ShaderProgram("mergedParts", [
+    shaders.VertexShader("""
+        uniform mat4 u_mvp;
+        uniform mat3 u_normal;
+        uniform float u_part_z[%d];
+        attribute vec4 a_position;
+        attribute vec3 a_normal;
+        attribute vec4 a_color;
+        attribute float a_part;
+        varying vec4 v_color;
+        varying vec3 v_normal;
+        void main() {
+            v_normal = normalize(u_normal * a_normal);
+            v_color = a_color;
+            vec4 position = a_position;
+            position.z += u_part_z[int(a_part + 0.5)];
+            gl_Position = u_mvp * position;
+        }
+    """ % MERGED_MAX_PARTS),
+    shaders.getShaderProgram("shaded").shaders[1],
+], uniforms={"u_part_z": [0.0] * MERGED_MAX_PARTS})
+
+def merge_meshes(meshes, colors):
+    """
+    Concatenates MeshData parts into one.
+    meshes: MeshData per part; colors: RGBA per part, stored as vertex colors
+    returns: (MeshData with the parts' vertex normals, (V,) float32 part
+    index of every vertex)
+    """
+    verts, normals, faces, vertex_colors, parts = [], [], [], [], []
+    offset = 0
+    for i, (mesh, color) in enumerate(zip(meshes, colors)):
+        part_verts = mesh.vertexes()
+        verts.append(part_verts)
+        normals.append(mesh.vertexNormals())
+        faces.append(mesh.faces() + offset)
+        vertex_colors.append(np.broadcast_to(np.asarray(color, dtype=np.float32), (len(part_verts), 4)))
+        parts.append(np.full(len(part_verts), i, dtype=np.float32))
+        offset += len(part_verts)
+
+    # the parts keep their own normals instead of being averaged across
+    # part boundaries
+    merged = _mesh_with_normals(
+        np.concatenate(verts).astype(np.float32),
+        np.concatenate(faces).astype(np.uint32),
+        np.concatenate(normals).astype(np.float32),
+        vertexColors=np.concatenate(vertex_colors),
+    )
+    return merged, np.concatenate(parts)
+
+class MergedMeshItem(gl.GLMeshItem):
+    """
+    Several rigid parts drawn as one mesh in a single draw call.
+
+    Each part keeps its own vertex range, color and z offset; setPartOffsets
+    moves the parts by updating a uniform array, so per-frame moves need no
+    transforms or uploads. Parts are drawn with the "shaded" lighting.
+
+    meshes, colors: MeshData and RGBA color per part (at most MERGED_MAX_PARTS)
+    """
+    def __init__(self, meshes, colors, **kwds):
+        if len(meshes) > MERGED_MAX_PARTS:
+            raise ValueError(f"at most {MERGED_MAX_PARTS} parts can be merged")
+        meshdata, self.part_index = merge_meshes(meshes, colors)
+        self.part_z = np.zeros(MERGED_MAX_PARTS)
+        kwds.setdefault("shader", MERGED_PARTS_SHADER)
+        super().__init__(meshdata=meshdata, **kwds)
+        self.m_vbo_part = QtGui.QOpenGLBuffer(QtGui.QOpenGLBuffer.Type.VertexBuffer)
+
+    def setPartOffsets(self, offsets):
+        """
+        Z offset of every part, in the order they were given.
+        """
+        self.part_z[:len(offsets)] = offsets
+        self.update()
+
+    def paint(self):
+        shader = self.shader()
+        shader["u_part_z"] = self.part_z
+        loc = _enable_float_attribute(shader, "a_part", self.m_vbo_part, self.part_index)
+        try:
+            super().paint()
+        finally:
+            if loc != -1:
+                GL.glDisableVertexAttribArray(loc)
+
+def _enable_float_attribute(shader, name, vbo, data):
+    """
+    Points the float vertex attribute name of shader's program at data,
+    uploading data to vbo on first use. Returns the attribute location to
+    disable after drawing, or -1 when the program doesn't use it.
+    """
+    context = QtGui.QOpenGLContext.currentContext()
+    program = shader.program(es2_compat=context.hasExtension(b"GL_ARB_ES2_compatibility"))
+    loc = GL.glGetAttribLocation(program, name)
+    if loc == -1:
+        return loc
+    if not vbo.isCreated():
+        vbo.create()
+        vbo.bind()
+        vbo.allocate(data, data.nbytes)
+    else:
+        vbo.bind()
+    GL.glVertexAttribPointer(loc, 1, GL.GL_FLOAT, False, 0, None)
+    vbo.release()
+    GL.glEnableVertexAttribArray(loc)
+    return loc
@@ -27,15 +27,67 @@ def calculate_active_coils(spring_rate, wire_diameter, inner_diameter, shear_mod
     n_active = (shear_modulus * wire_diameter**4) / (8 * spring_rate * D**3)
     return n_active
 
-def compute_frames(path_pts):
+def compute_tangents(path_pts):
     """
-    Compute tangent, normal, binormal frames via parallel transport.
+    Unit forward-difference tangents along a path; the last point reuses
+    the previous tangent.
     """
-    # Compute tangents
     tangents = np.diff(path_pts, axis=0)
     tangents = np.vstack([tangents, tangents[-1]])          # last tangent = previous
     tangents /= np.linalg.norm(tangents, axis=1)[:,None]
-    
+    return tangents
+
+def _helix_frames(path_pts, tangents):
+    """
+    Closed-form parallel transport for a uniform helix about the z axis
+    (constant radius, angle step and rise per point).
+
+    Between consecutive points the chord tangent is carried by the same
+    screw motion, so transporting the frame adds a fixed roll angle each
+    step relative to the horizontal section axis.
+
+    Returns (normals, binorms), or None when path_pts is not such a helix.
+    """
+    if len(path_pts) < 3:
+        return None
+
+    x, y, z = path_pts[:, 0], path_pts[:, 1], path_pts[:, 2]
+    radius = np.hypot(x, y)
+    d_theta = np.diff(np.unwrap(np.arctan2(y, x)))
+    dz = np.diff(z)
+    if radius[0] <= 0 or d_theta[0] == 0:
+        return None
+    if not (np.allclose(radius, radius[0], rtol=1e-6, atol=0)
+            and np.allclose(d_theta, d_theta[0], rtol=1e-6, atol=1e-9)
+            and np.allclose(dz, dz[0], rtol=1e-6, atol=1e-9 * radius[0])):
+        return None
+
+    # horizontal section axis and its partner, both orthogonal to the tangent
+    e1 = np.cross(tangents, np.array([0, 0, 1.0]))
+    e1 /= np.linalg.norm(e1, axis=1)[:, None]
+    e2 = np.cross(tangents, e1)
+
+    # roll picked up by rotating e1[0] from tangents[0] onto tangents[1]
+    t0, t1 = tangents[0], tangents[1]
+    axis = np.cross(t0, t1)
+    s = np.linalg.norm(axis)
+    c = np.dot(t0, t1)
+    axis /= s
+    moved = e1[0] * c + np.cross(axis, e1[0]) * s + axis * np.dot(axis, e1[0]) * (1 - c)
+    step = np.arctan2(np.dot(moved, e2[1]), np.dot(moved, e1[1]))
+
+    roll = step * np.arange(len(path_pts))
+    roll[-1] = roll[-2]  # last tangent repeats the previous one
+    normals = np.cos(roll)[:, None] * e1 + np.sin(roll)[:, None] * e2
+    binorms = np.cross(tangents, normals)
+    return normals, binorms
+
+def _projected_frames(path_pts, tangents):
+    """
+    Parallel transport by projecting each normal onto the plane of the next
+    tangent, point by point. Works for any path.
+    Returns (normals, binorms).
+    """
     # Pick an arbitrary initial normal
     #    (e.g. project world‐Z onto plane orthogonal to tangent[0])
     #    then Gram–Schmidt to get a stable frame
@@ -53,6 +105,20 @@ def compute_frames(path_pts):
         v = normals[i-1] - tangents[i] * np.dot(tangents[i], normals[i-1])
         normals[i] = v / np.linalg.norm(v)
         binorms[i] = np.cross(tangents[i], normals[i])
+    return normals, binorms
+
+def compute_frames(path_pts):
+    """
+    Compute tangent, normal, binormal frames via parallel transport.
+    Uniform helices (every spring path) are handled in closed form;
+    other paths fall back to propagating the normal point by point.
+    """
+    tangents = compute_tangents(path_pts)
+
+    frames = _helix_frames(path_pts, tangents)
+    if frames is None:
+        frames = _projected_frames(path_pts, tangents)
+    normals, binorms = frames
     return tangents, normals, binorms
 
 import numpy as np
@@ -128,57 +194,96 @@ def calculate_active_coils_rectangular(
 
     return n_active, wire_height
 
+def solve_spring_stack(rates, free_lengths, bind_lengths, available_length):
+    """
+    Compress a stack of springs in series (e.g. main, helper, tender and
+    bump spring) into the available length, using free lengths as maxima
+    and bind lengths as minima.
+
+    Parameters
+    ----------
+    rates : array_like, shape (..., N)
+        Spring rates; the last axis runs over the springs in the stack.
+    free_lengths : array_like, shape (..., N)
+        Free lengths, same units as available_length.
+    bind_lengths : array_like, shape (..., N)
+        Lengths at bind.
+    available_length : array_like
+        Total length available to the stack. Broadcasts against the leading
+        axes of the spring arrays, so every travel sample (and every design
+        in a sweep) is solved at once.
+
+    Returns
+    -------
+    lengths : ndarray, shape (..., N)
+        Length of each spring.
+    force : ndarray, shape (...)
+        Force carried by the stack (the same through every spring).
+
+    Notes
+    -----
+    Spring i reaches bind at force F_i = k_i (L_free_i - L_bind_i). Between
+    bind events the stack length is linear in force:
+        L(F) = sum_bound L_bind_i + sum_free (L_free_i - F / k_i)
+    so the force is solved assuming a set of bound springs, any spring whose
+    F_i the solution exceeds is added to the set, and the solve is repeated.
+    The set only grows, so at most N passes are needed. Once every spring is
+    bound the force is capped at the largest F_i (solid stack).
+    """
+    k = np.asarray(rates, dtype=float)
+    L_free = np.asarray(free_lengths, dtype=float)
+    L_bind = np.asarray(bind_lengths, dtype=float)
+    L_available = np.asarray(available_length, dtype=float)[..., None]
+    k, L_free, L_bind, L_available = np.broadcast_arrays(k, L_free, L_bind, L_available)
+    L_available = L_available[..., 0]
+
+    compliance = 1.0 / k
+    bind_force = (L_free - L_bind) * k
+    solid_force = bind_force.max(axis=-1)
+
+    bound = np.zeros(k.shape, dtype=bool)
+    for _ in range(k.shape[-1]):
+        free_compliance = np.where(bound, 0.0, compliance).sum(axis=-1)
+        rest_length = np.where(bound, L_bind, L_free).sum(axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            force = (rest_length - L_available) / free_compliance
+        force = np.where(free_compliance > 0, force, solid_force)
+
+        now_bound = bind_force <= force[..., None]
+        if np.array_equal(now_bound, bound):
+            break
+        bound = now_bound
+
+    # with plenty of room every spring sits at free length and carries no force
+    force = np.clip(force, 0.0, solid_force)
+    lengths = np.maximum(L_free - force[..., None] * compliance, L_bind)
+    return lengths, force
+
 def split_strut_length_to_springs(
     k_main: float,
     k_helper: float,
-    L_available: float,
+    L_available,
     L_bind_main: float,
     L_bind_helper: float,
     L_free_main: float,
     L_free_helper: float
-) -> tuple[float, float, float]:
+):
     """
     Distribute a total strut length between two springs in series,
     using free lengths as maxima and bind lengths as minima.
+    Two-spring form of solve_spring_stack.
 
-    Returns (L_main, L_helper).
-    """
-    # Total free length
-    L_free_tot = L_free_main + L_free_helper
-
-    # If there's plenty of room, both at free length
-    if L_available >= L_free_tot:
-        spring_force = 0
-        return L_free_main, L_free_helper, spring_force
-
-    # Compute total deflection from free position
-    delta_tot = L_free_tot - L_available
-
-    # Series spring force
-    spring_force = 1 / (1.0/k_main + 1.0/k_helper) * delta_tot # F = -kx
+    All arguments broadcast, so L_available may be an array of travel samples.
 
-    # Individual deltas
-    delta_main   = spring_force / k_main
-    delta_helper = spring_force / k_helper
-
-    # Preliminary lengths
-    L_main   = L_free_main   - delta_main
-    L_helper = L_free_helper - delta_helper
-
-    # Enforce bind limits (limit whichever hits bind first)
-    if L_helper < L_bind_helper:
-        # helper has bottomed out
-        L_helper = L_bind_helper
-        # remaining deflection goes into main
-        rem = delta_tot - (L_free_helper - L_bind_helper)
-        L_main = max(L_bind_main, L_free_main - rem)
-        spring_force = (L_free_main - L_main) * k_main
-
-    elif L_main < L_bind_main:
-        L_main = L_bind_main
-        rem = delta_tot - (L_free_main - L_bind_main)
-        L_helper = max(L_bind_helper, L_free_helper - rem)
-        spring_force = (L_free_helper - L_helper) * k_helper
-
-    return L_main, L_helper, spring_force
+    Returns (L_main, L_helper, spring_force) as arrays.
+    """
+    def stack(main, helper):
+        return np.stack(np.broadcast_arrays(main, helper), axis=-1)
 
+    lengths, spring_force = solve_spring_stack(
+        stack(k_main, k_helper),
+        stack(L_free_main, L_free_helper),
+        stack(L_bind_main, L_bind_helper),
+        L_available
+    )
+    return lengths[..., 0], lengths[..., 1], spring_force
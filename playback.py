@@ -0,0 +1,154 @@
+import time
+from collections import deque
+
+from PyQt5 import QtCore
+
+PLAYBACK_SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0)
+
+class FrameStats:
+    """
+    Rolling frame timings of a fixed-rate animation.
+
+    Each frame records the time since the previous one and the time spent
+    updating the scene. Paints run on the same thread as the frame timer, so
+    a slow render shows up as a late next frame; every target interval that
+    passes without a frame counts as dropped.
+    """
+
+    def __init__(self, target_interval, window=120):
+        self.target_interval = target_interval
+        self.intervals = deque(maxlen=window)
+        self.work = deque(maxlen=window)
+        self.frames = 0
+        self.dropped = 0
+
+    def reset(self):
+        self.intervals.clear()
+        self.work.clear()
+        self.frames = 0
+        self.dropped = 0
+
+    def add_frame(self, interval, work):
+        self.frames += 1
+        self.intervals.append(interval)
+        self.work.append(work)
+        self.dropped += max(0, round(interval / self.target_interval) - 1)
+
+    @property
+    def frame_time(self):
+        """
+        Mean time between frames over the window, s.
+        """
+        return sum(self.intervals) / len(self.intervals) if self.intervals else 0.0
+
+    @property
+    def fps(self):
+        frame_time = self.frame_time
+        return 1.0 / frame_time if frame_time > 0 else 0.0
+
+    def summary(self):
+        work = sum(self.work) / len(self.work) if self.work else 0.0
+        return (
+            f"Frame time: {self.frame_time*1000:.1f} ms (update {work*1000:.1f} ms)\n"
+            f"FPS: {self.fps:.1f} / {1/self.target_interval:.0f}\n"
+            f"Dropped frames: {self.dropped} of {self.frames + self.dropped}"
+        )
+
+class PlaybackController(QtCore.QObject):
+    """
+    Plays the travel animation from a frame timer.
+
+    position is the fractional slider position (0 to 100). Each frame
+    advances it by the real time elapsed since the last one, so playback
+    keeps its speed when frames are dropped, and passes it to show_position.
+    A looping playback bounces between full droop and full bump; otherwise
+    it stops at the end of the travel.
+    """
+
+    playingChanged = QtCore.pyqtSignal(bool)
+    statsUpdated = QtCore.pyqtSignal()
+
+    FRAME_INTERVAL = 1 / 60 # s
+    STROKE_SECONDS = 3.0 # full travel at speed 1
+    STATS_EVERY = 15 # frames between statsUpdated signals
+
+    def __init__(self, show_position, parent=None):
+        super().__init__(parent)
+        self.show_position = show_position
+        self.speed = 1.0
+        self.loop = True
+        self.position = 0.0
+        self.direction = 1
+        self.last_tick = None
+        self.stats = FrameStats(self.FRAME_INTERVAL)
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.setInterval(round(self.FRAME_INTERVAL * 1000))
+        self.timer.timeout.connect(self.tick)
+
+    def is_playing(self):
+        return self.timer.isActive()
+
+    def play(self, position):
+        """
+        Start playing from the slider position; a finished non-looping
+        playback starts over.
+        """
+        if self.is_playing():
+            return
+        self.position = float(position)
+        if self.position >= 100:
+            if self.loop:
+                self.direction = -1
+            else:
+                self.position = 0.0
+                self.direction = 1
+        elif self.position <= 0:
+            self.direction = 1
+
+        self.stats.reset()
+        self.last_tick = time.perf_counter()
+        self.timer.start()
+        self.playingChanged.emit(True)
+
+    def pause(self):
+        if not self.is_playing():
+            return
+        self.timer.stop()
+        self.statsUpdated.emit()
+        self.playingChanged.emit(False)
+
+    def toggle(self, position):
+        if self.is_playing():
+            self.pause()
+        else:
+            self.play(position)
+
+    def tick(self):
+        """
+        Advance and show one frame.
+        """
+        now = time.perf_counter()
+        interval, self.last_tick = now - self.last_tick, now
+
+        self.position += self.direction * interval * self.speed * 100 / self.STROKE_SECONDS
+        finished = False
+        if self.loop:
+            while not 0 <= self.position <= 100:
+                if self.position > 100:
+                    self.position = 200 - self.position
+                    self.direction = -1
+                else:
+                    self.position = -self.position
+                    self.direction = 1
+        elif not 0 <= self.position <= 100:
+            self.position = min(max(self.position, 0.0), 100.0)
+            finished = True
+
+        self.show_position(self.position)
+        self.stats.add_frame(interval, time.perf_counter() - now)
+        if self.stats.frames % self.STATS_EVERY == 0:
+            self.statsUpdated.emit()
+        if finished:
+            self.pause()
@@ -0,0 +1,69 @@
+from PyQt5 import QtCore
+
+class RecomputeScheduler(QtCore.QObject):
+    """
+    Coalesces input edits and slider moves into at most one recompute per
+    event loop pass.
+
+    Requests only set flags and start a zero-delay timer; when it fires, a
+    pending update runs once however many edits asked for it, and of the
+    slider positions requested meanwhile only the latest is animated.
+    requested / executed count the requests received and the recomputes
+    actually run.
+    """
+
+    def __init__(self, update, animate, mark_dirty, parent=None):
+        super().__init__(parent)
+        self.update = update
+        self.animate = animate
+        self.mark_dirty = mark_dirty
+
+        self.update_pending = False
+        self.dirty_pending = False
+        self.pending_step = None
+        self.requested = 0
+        self.executed = 0
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.flush)
+
+    def request_update(self, dirty=False):
+        """
+        Schedule a full update; dirty also re-checks the unsaved-changes flag.
+        """
+        self.requested += 1
+        self.update_pending = True
+        self.dirty_pending = self.dirty_pending or dirty
+        self.timer.start()
+
+    def request_step(self, step):
+        """
+        Schedule animating the slider position step, replacing any position
+        that hasn't been drawn yet.
+        """
+        self.requested += 1
+        self.pending_step = step
+        self.timer.start()
+
+    def flush(self):
+        """
+        Run whatever is pending now.
+        """
+        self.timer.stop()
+        if not (self.update_pending or self.dirty_pending or self.pending_step is not None):
+            return
+
+        update, dirty, step = self.update_pending, self.dirty_pending, self.pending_step
+        self.update_pending = self.dirty_pending = False
+        self.pending_step = None
+
+        # an update also animates to the current slider position
+        if update:
+            self.update()
+        elif step is not None:
+            self.animate(step)
+        if dirty:
+            self.mark_dirty()
+        self.executed += 1
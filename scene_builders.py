@@ -0,0 +1,221 @@
+"""
+Geometry of the designer's 3D scene, built from a project snapshot.
+
+Nothing here touches Qt widgets or GL items: build_scene() only evaluates the
+model and creates mesh data, so it can run on the scene worker thread while
+the designer turns its result into items on the GUI thread.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+import clearance
+import mesh_utils
+from coilover_model import COILOVER_INPUTS, CoiloverModel
+from physics_utils import calculate_active_coils
+
+# slider positions 0..100, see build_keyframes
+KEYFRAME_STEPS = 101
+
+# Immutable result of build_scene. meshes maps mesh names to the mesh
+# data (or spring paths) of the parts that were rebuilt.
+SceneResult = namedtuple("SceneResult", (
+    "model",
+    "inputs",
+    "changed",
+    "meshes",
+    "travel_vals",
+    "force_vals",
+    "ride_state",
+    "keyframes",
+    "clearances",
+))
+
+def main_spring_coils(model):
+    return calculate_active_coils(50, model.spring_wire_diameter, model.spring_id)
+
+def scene_lod(model, pixels_per_mm=None, coarse=False):
+    """
+    Tessellation of the parts drawn with a level of detail, keyed like the
+    model inputs so build_scene rebuilds a part when its level changes.
+    pixels_per_mm is the on-screen scale of the view (None for the finest
+    level) and coarse drops a few levels while the view is being dragged.
+    """
+    spring_samples, spring_sides = mesh_utils.helix_lod(
+        main_spring_coils(model), model.spring_id + model.spring_wire_diameter,
+        model.spring_wire_diameter, pixels_per_mm, coarse)
+    helper_samples, _ = mesh_utils.helix_lod(
+        model.helper_coils, model.helper_inner_diameter + model.helper_wire_width,
+        model.helper_wire_height, pixels_per_mm, coarse)
+    return {
+        "spring_samples": spring_samples,
+        "spring_sides": spring_sides,
+        "helper_samples": helper_samples,
+        "helper_perch_sectors": mesh_utils.circle_lod(model.helper_outer_diameter, pixels_per_mm, coarse),
+    }
+
+def build_damper_body(model, lod):
+    return {"body_mesh": mesh_utils.make_cylinder(model.damper_body_diameter/2, model.damper_body_length, 32)}
+
+def build_damper_shaft(model, lod):
+    return {"shaft_mesh": mesh_utils.make_cylinder(model.damper_shaft_diameter/2, model.shaft_length, 16)}
+
+def main_spring_path(model, samples):
+    """
+    Main spring centerline at free length; apply_state stretches it to the
+    travel position on the GPU.
+    """
+    theta  = np.linspace(0, 2*np.pi*main_spring_coils(model), samples)
+    r = (model.spring_id + model.spring_wire_diameter)/2
+    return np.vstack((r * np.cos(theta), r * np.sin(theta), np.linspace(model.spring_bottom_position, model.spring_upper_position, theta.size))).T
+
+def helper_spring_path(model, samples):
+    """
+    Helper spring centerline at free length.
+    """
+    theta  = np.linspace(0, 2 * np.pi * model.helper_coils, samples)
+    r = (model.helper_inner_diameter + model.helper_wire_width) / 2
+    return np.vstack((r * np.cos(theta), r * np.sin(theta), np.linspace(model.helper_spring_lower_position, model.helper_spring_upper_position, theta.size))).T
+
+def build_main_spring(model, lod):
+    path = main_spring_path(model, lod["spring_samples"])
+    return {
+        "spring_path": path,
+        "spring_mesh": mesh_utils.make_spring_wire(path, model.spring_wire_diameter/2, lod["spring_sides"]),
+    }
+
+def build_helper_spring(model, lod):
+    path = helper_spring_path(model, lod["helper_samples"])
+    return {
+        "helper_spring_path": path,
+        "helper_spring_mesh": mesh_utils.make_rectangular_spring_wire(path, model.helper_wire_width, model.helper_wire_height),
+    }
+
+def build_upper_perch(model, lod):
+    # apply_state puts the plate's bottom on the top of the shaft, with the
+    # cone's base ring on top of the plate (see clearance.part_profiles)
+    return {
+        "upper_perch": mesh_utils.make_cylinder(model.upper_perch_outer_diameter/2.0, model.upper_perch_thickness, sectors=32),
+        "upper_cone": mesh_utils.make_cone(model.upper_perch_outer_diameter/2.0, model.upper_perch_tapered_height, sectors=32),
+    }
+
+def build_lower_perch(model, lod):
+    # ring threaded on the damper body, its top face is the spring seat
+    return {"lower_perch": mesh_utils.make_annular_cylinder(
+        model.lower_perch_outer_diameter/2.0, model.damper_body_diameter/2.0, model.lower_perch_thickness, sectors=32)}
+
+def build_helper_perch(model, lod):
+    hole_r = (model.helper_inner_diameter - 2 * model.helper_perch_thickness) / 2.0 # second ring’s hole radius
+
+    # flat ring plus the inner step ring; apply_state positions it
+    return {"helper_perch": mesh_utils.make_stepped_annulus(
+        model.helper_outer_diameter / 2,
+        model.helper_inner_diameter / 2,
+        hole_r,
+        model.helper_perch_thickness,
+        model.helper_inner_height,
+        sectors=lod["helper_perch_sectors"]
+    )}
+
+# Scene parts: the model inputs and scene_lod keys each builder reads, and
+# the builder. Positions that follow the travel slider are applied in
+# apply_state instead.
+SCENE_COMPONENTS = (
+    (("damper_body_diameter", "damper_body_length"), build_damper_body),
+    (("damper_shaft_diameter", "damper_comp_length"), build_damper_shaft),
+    # the springs' rest heights move with the spring seat and free lengths
+    (("spring_id", "spring_wire_diameter", "spring_free_length", "damper_body_length",
+      "lower_perch_position", "spring_samples", "spring_sides"), build_main_spring),
+    (("helper_outer_diameter", "helper_inner_diameter", "helper_spring_rate", "helper_spring_bind_length",
+      "helper_spring_free_length", "helper_thickness", "spring_wire_diameter", "spring_free_length",
+      "damper_body_length", "lower_perch_position", "helper_samples"), build_helper_spring),
+    (("upper_perch_outer_diameter", "upper_perch_thickness", "upper_perch_tapered_height"), build_upper_perch),
+    (("lower_perch_outer_diameter", "lower_perch_thickness", "damper_body_diameter"), build_lower_perch),
+    (("helper_outer_diameter", "helper_inner_diameter",
+      "helper_thickness", "helper_inner_height", "helper_perch_sectors"), build_helper_perch),
+)
+
+def build_keyframes(model):
+    """
+    Travel states (STATE_DTYPE) for every slider position.
+    """
+    states = model.compute_states(np.arange(KEYFRAME_STEPS) / (KEYFRAME_STEPS - 1))
+    states.setflags(write=False)
+    return states
+
+def keyframe_state(keyframes, position):
+    """
+    Travel state at a fractional slider position, linearly interpolated
+    between the neighbouring keyframes.
+    """
+    lo = min(int(position), KEYFRAME_STEPS - 2)
+    a = position - lo
+    if a == 0:
+        return keyframes[lo]
+    s0, s1 = keyframes[lo], keyframes[lo + 1]
+    state = np.empty((), dtype=keyframes.dtype)
+    for name in state.dtype.names:
+        state[name] = s0[name] + a * (s1[name] - s0[name])
+    return state[()]
+
+def spring_stretch(rest_lower, rest_upper, lower, upper):
+    """
+    (scale, offset) mapping a spring centerline's rest heights to
+    scale * z + offset so its ends sit at lower and upper, for
+    mesh_utils.SpringItem.setStretch.
+    """
+    rest_length = rest_upper - rest_lower
+    scale = (upper - lower) / rest_length if rest_length else 1.0
+    return scale, lower - scale * rest_lower
+
+def build_scene(project_state, scene_inputs, samples=150, is_stale=None, pixels_per_mm=None, coarse=False):
+    """
+    Evaluate a project snapshot: the model, its force curve, the selected
+    corner's ride height and the mesh data of every part whose inputs or
+    level of detail (see scene_lod) differ from scene_inputs (all parts when
+    it is empty). The keyframe states and the clearances between the parts
+    (a clearance.ClearanceResult over the keyframes) only depend on the
+    model, so they are rebuilt when a model input (or for the clearances, a
+    toggle in clearance.CLEARANCE_TOGGLES) changed, otherwise they are None.
+    Returns None for invalid inputs, or when is_stale() turns true between
+    parts because a newer snapshot is waiting.
+    """
+    try:
+        model = CoiloverModel.from_project(project_state)
+    except ValueError:
+        return None
+
+    inputs = {name: getattr(model, name) for name in COILOVER_INPUTS}
+    inputs.update({name: bool(model.toggles.get(name)) for name in clearance.CLEARANCE_TOGGLES})
+    lod = scene_lod(model, pixels_per_mm, coarse)
+    inputs.update(lod)
+    changed = frozenset(name for name, value in inputs.items() if scene_inputs.get(name) != value)
+
+    meshes = {}
+    for deps, builder in SCENE_COMPONENTS:
+        if is_stale is not None and is_stale():
+            return None
+        if not scene_inputs or changed.intersection(deps):
+            meshes.update(builder(model, lod))
+
+    keyframes = clearances = None
+    if not scene_inputs or changed.intersection(COILOVER_INPUTS):
+        keyframes = build_keyframes(model)
+    if keyframes is not None or changed.intersection(clearance.CLEARANCE_TOGGLES):
+        clearances = clearance.compute_clearances(model, build_keyframes(model) if keyframes is None else keyframes)
+
+    travel_vals, force_vals = model.compute_force_curve(samples)
+    travel_vals.setflags(write=False)
+    force_vals.setflags(write=False)
+
+    return SceneResult(
+        model=model,
+        inputs=inputs,
+        changed=changed,
+        meshes=meshes,
+        travel_vals=travel_vals,
+        force_vals=force_vals,
+        ride_state=model.compute_ride_height(travel_vals, force_vals),
+        keyframes=keyframes,
+        clearances=clearances,
+    )
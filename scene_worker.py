@@ -0,0 +1,57 @@
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5 import QtCore
+
+class SceneWorker(QtCore.QObject):
+    """
+    Runs fn on a background thread, latest request wins.
+
+    Every submit() starts a new generation. A request still waiting in the
+    queue is cancelled by the next one, and a running one is told through
+    the is_stale callable passed to fn so it can stop early. Only results of
+    the latest generation are delivered, via resultReady on the GUI thread.
+    """
+
+    resultReady = QtCore.pyqtSignal(int, object)
+
+    def __init__(self, fn, parent=None):
+        super().__init__(parent)
+        self.fn = fn
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene-worker")
+        self.generation = 0
+        self.future = None
+
+    def submit(self, *args, **kwargs):
+        """
+        Queue fn(*args, **kwargs) and return its generation.
+        """
+        self.generation += 1
+        if self.future is not None:
+            self.future.cancel()
+        self.future = self.executor.submit(self._run, self.generation, args, kwargs)
+        self.future.add_done_callback(self._report_error)
+        return self.generation
+
+    def is_stale(self, generation):
+        return generation != self.generation
+
+    def _run(self, generation, args, kwargs):
+        result = self.fn(*args, is_stale=lambda: self.is_stale(generation), **kwargs)
+        if result is not None and not self.is_stale(generation):
+            self.resultReady.emit(generation, result)
+        return generation, result
+
+    def _report_error(self, future):
+        if not future.cancelled() and future.exception() is not None:
+            e = future.exception()
+            traceback.print_exception(type(e), e, e.__traceback__)
+
+    def wait(self):
+        """
+        Block until the latest request is done and return its
+        (generation, result), for callers that need the result right away.
+        """
+        if self.future is None:
+            return None
+        return self.future.result()
@@ -0,0 +1,173 @@
+"""
+Spring catalog index.
+
+A catalog is a CSV or JSON list of springs with the columns in CATALOG_FIELDS
+(lengths in mm, rates in N/mm; pass unit="in" for inches and lbf/in). Entries
+are held column-wise in arrays sorted by inner diameter, then rate, so a query
+is a binary search on the diameter followed by a mask over that slice.
+
+load_catalog() keeps a compiled copy of the catalog next to the source file
+(<catalog>.npy plus a <catalog>.npy.json sidecar with the source hash) and
+memory-maps it on later loads, so startup doesn't parse the source again.
+"""
+import csv
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from coilover_model import LBF_IN_PER_N_MM, MM_PER_INCH
+
+CATALOG_FIELDS = ("part_number", "inner_diameter", "free_length", "rate", "bind_length", "wire_diameter")
+CATALOG_LENGTHS = ("inner_diameter", "free_length", "bind_length", "wire_diameter")
+
+# bump when the layout of the compiled .npy catalog changes
+CATALOG_CACHE_VERSION = 1
+
+class SpringCatalog:
+    """
+    Column arrays of catalog springs, sorted by inner diameter then rate.
+    The columns are views of one structured array (self.records), which may
+    be memory-mapped from a compiled catalog.
+    """
+
+    def __init__(self, records):
+        self.records = records
+        for name in CATALOG_FIELDS:
+            setattr(self, name, records[name])
+
+    def __len__(self):
+        return self.records.size
+
+    @classmethod
+    def from_columns(cls, columns):
+        """
+        Build a catalog from unsorted column arrays keyed by CATALOG_FIELDS.
+        """
+        part_numbers = np.asarray(columns["part_number"], dtype=str)
+        dtype = [("part_number", part_numbers.dtype)] + [(name, np.float64) for name in CATALOG_FIELDS[1:]]
+
+        order = np.lexsort((columns["rate"], columns["inner_diameter"]))
+        records = np.empty(part_numbers.size, dtype=dtype)
+        for name in CATALOG_FIELDS:
+            records[name] = np.asarray(columns[name])[order]
+        return cls(records)
+
+    @classmethod
+    def from_rows(cls, rows, unit="mm"):
+        """
+        Build a catalog from dicts keyed by CATALOG_FIELDS.
+        Raises ValueError if a field is missing or not a number.
+        """
+        rows = list(rows)
+        try:
+            columns = {"part_number": [str(row["part_number"]) for row in rows]}
+            for name in CATALOG_FIELDS[1:]:
+                columns[name] = np.array([float(row[name]) for row in rows], dtype=float)
+        except KeyError as e:
+            raise ValueError(f"catalog entry is missing {e.args[0]}") from None
+
+        if unit == "in":
+            for name in CATALOG_LENGTHS:
+                columns[name] *= MM_PER_INCH
+            columns["rate"] /= LBF_IN_PER_N_MM
+        return cls.from_columns(columns)
+
+    @classmethod
+    def from_file(cls, path, unit="mm"):
+        """
+        Load a .csv or .json catalog file.
+        """
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            if path.lower().endswith(".json"):
+                return cls.from_rows(json.load(f), unit)
+            return cls.from_rows(csv.DictReader(f), unit)
+
+    def query(self, inner_diameter=None, id_tolerance=0.5, rate=None, rate_tolerance=0.1,
+              max_free_length=None, max_bind_length=None):
+        """
+        Indices of the springs matching every given constraint:
+        inner diameter within id_tolerance (mm), rate within rate_tolerance
+        (fraction of rate) and free/bind length at most the given maximum.
+        """
+        lo, hi = 0, len(self)
+        if inner_diameter is not None:
+            lo = int(np.searchsorted(self.inner_diameter, inner_diameter - id_tolerance, side="left"))
+            hi = int(np.searchsorted(self.inner_diameter, inner_diameter + id_tolerance, side="right"))
+
+        mask = np.ones(hi - lo, dtype=bool)
+        if rate is not None:
+            rates = self.rate[lo:hi]
+            mask &= np.abs(rates - rate) <= abs(rate) * rate_tolerance
+        if max_free_length is not None:
+            mask &= self.free_length[lo:hi] <= max_free_length
+        if max_bind_length is not None:
+            mask &= self.bind_length[lo:hi] <= max_bind_length
+        return lo + np.flatnonzero(mask)
+
+    def entry(self, i):
+        """
+        One spring as a dict keyed by CATALOG_FIELDS.
+        """
+        return {name: getattr(self, name)[i].item() for name in CATALOG_FIELDS}
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_catalog(path, unit="mm"):
+    """
+    Load a catalog through its compiled cache, rebuilding the cache when the
+    source file's hash, the unit or CATALOG_CACHE_VERSION changed. The size
+    and modification time are checked first so an unchanged source isn't
+    hashed on every load. If the cache can't be written (e.g. a read-only
+    directory) the parsed catalog is returned uncached.
+    """
+    cache_path = path + ".npy"
+    meta_path = cache_path + ".json"
+    stat = os.stat(path)
+    source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = {}
+
+    sha256 = None
+    if meta.get("version") == CATALOG_CACHE_VERSION and meta.get("unit") == unit:
+        current = meta.get("source") == source
+        if not current:
+            sha256 = _file_hash(path)
+        if not current and meta.get("sha256") == sha256:
+            # touched but not changed, only refresh the stamp
+            meta["source"] = source
+            current = True
+            try:
+                with open(meta_path, "w", encoding="utf-8") as f:
+                    json.dump(meta, f)
+            except OSError:
+                pass
+        if current:
+            try:
+                return SpringCatalog(np.load(cache_path, mmap_mode="r"))
+            except (OSError, ValueError):
+                pass
+
+    catalog = SpringCatalog.from_file(path, unit)
+    meta = {"version": CATALOG_CACHE_VERSION, "unit": unit, "source": source, "sha256": sha256 or _file_hash(path)}
+    try:
+        # write to temp files first so a partial cache is never picked up
+        with open(cache_path + ".tmp", "wb") as f:
+            np.save(f, catalog.records)
+        with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(cache_path + ".tmp", cache_path)
+        os.replace(meta_path + ".tmp", meta_path)
+    except OSError:
+        pass
+    return catalog
@@ -0,0 +1,180 @@
+"""
+Parameter sweeps for spring selection.
+
+Every combination of the swept inputs (the Cartesian product of their value
+ranges) is evaluated with the full travel model. Designs are evaluated a chunk
+at a time as arrays, one row per design, and the chunks are spread over a
+process pool. The result keeps the Pareto set on ride height error, bump
+(heave) travel and droop (rebound) travel.
+
+    result = run_sweep(
+        CoiloverModel.from_file("my_car.sus"),
+        {"spring_rate": np.linspace(50, 120, 15), "lower_perch_position": np.arange(0, 40, 2.5)},
+        target_ride_height=100,
+    )
+    best = result["pareto"]
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from coilover_model import COILOVER_INPUTS, CoiloverModel
+
+SWEEP_CHUNK_SIZE = 4096
+
+def ride_height_travel(travel_vals, force_vals, target_force):
+    """
+    Travel at which each row of force_vals reaches target_force. Row-wise
+    version of the interpolation in CoiloverModel.compute_ride_height: loads
+    outside the force range sit at the first or last travel sample.
+    """
+    target = np.clip(target_force, force_vals[:, 0], force_vals[:, -1])
+    rows = np.arange(force_vals.shape[0])
+
+    idx = np.clip(np.sum(force_vals < target[:, None], axis=1), 1, force_vals.shape[1] - 1)
+    f0, f1 = force_vals[rows, idx - 1], force_vals[rows, idx]
+    t0, t1 = travel_vals[rows, idx - 1], travel_vals[rows, idx]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = np.where(f1 > f0, (target - f0) / (f1 - f0), 1.0)
+
+    ride = t0 + w * (t1 - t0)
+    return np.where(target >= force_vals[:, -1], travel_vals[:, -1], ride)
+
+def pareto_front(costs):
+    """
+    Indices of the non-dominated rows of costs (n, m), all objectives
+    minimized. Of identical rows only one is kept.
+    """
+    costs = np.asarray(costs, dtype=float)
+    order = np.lexsort(costs.T[::-1])
+    sorted_costs = costs[order]
+
+    # after a lexicographic sort the first remaining row is never dominated
+    front = []
+    candidates = np.arange(len(sorted_costs))
+    while candidates.size:
+        best = candidates[0]
+        front.append(best)
+        dominated = np.all(sorted_costs[candidates] >= sorted_costs[best], axis=1)
+        candidates = candidates[~dominated]
+    return np.sort(order[front])
+
+def _sweep_values(axes, start, stop):
+    """
+    Input values of designs start..stop of the Cartesian product, as (D, 1)
+    columns so they broadcast against the travel samples.
+    """
+    index = np.unravel_index(np.arange(start, stop), [len(values) for values in axes])
+    return [np.asarray(values, dtype=float)[i][:, None] for values, i in zip(axes, index)]
+
+def evaluate_chunk(inputs, corner, names, axes, start, stop, samples):
+    """
+    Evaluate designs start..stop of the sweep. Runs in the worker processes,
+    so it only takes and returns plain data.
+    """
+    model = CoiloverModel({**inputs, **dict(zip(names, _sweep_values(axes, start, stop)))}, corner=corner)
+    states = model.compute_states(np.linspace(0, 1, samples))
+    travel_vals = states["travel"]
+    force_vals = states["spring_force"]
+
+    load = model.compute_corner_load()["coilover_force"]
+    ride = ride_height_travel(travel_vals, force_vals, np.full(stop - start, max(load, 0.0)))
+    max_travel = np.broadcast_to(model.max_travel, (stop - start, 1))[:, 0]
+
+    return {
+        "ride_height_position": ride,
+        "rebound_travel": ride,
+        "heave_travel": max_travel - ride,
+        # False where the springs never carry the corner load within the travel
+        "supported": (force_vals[:, 0] <= load) & (load <= force_vals[:, -1]),
+    }
+
+def run_sweep(model, ranges, target_ride_height, samples=150, chunk_size=SWEEP_CHUNK_SIZE,
+              workers=None, progress=None, cancel=None):
+    """
+    Sweep the inputs in ranges ({input name: values}) around model and
+    return the Pareto set.
+
+    target_ride_height is the desired ride height travel (mm of compression
+    from full droop) at the model's selected corner. progress(done, total)
+    is called as designs finish; cancel is polled between chunks and may be
+    anything with an is_set() method, e.g. a threading.Event. A cancelled
+    sweep returns the designs evaluated so far right away; chunks already
+    running in the worker processes finish in the background and their
+    results are discarded.
+
+    Returns a dict of arrays over the evaluated designs ("params" maps each
+    swept input to its values) plus "pareto", the indices of the designs on
+    the Pareto front of the supported ones.
+    """
+    names = list(ranges)
+    for name in names:
+        if name not in COILOVER_INPUTS:
+            raise ValueError(f"{name} can't be swept")
+    if model.compute_corner_load() is None:
+        raise ValueError(f"no corner load for {model.corner}, check the vehicle inputs")
+
+    axes = [np.asarray(ranges[name], dtype=float).ravel() for name in names]
+    total = int(np.prod([len(values) for values in axes]))
+    inputs = {name: value for name, value in model.inputs.items() if name not in names}
+    chunks = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+    args = (inputs, model.corner, names, axes)
+
+    results = {}
+    done = 0
+    cancelled = False
+
+    def finished(chunk, result):
+        nonlocal done
+        results[chunk] = result
+        done += chunk[1] - chunk[0]
+        if progress:
+            progress(done, total)
+
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            if cancel is not None and cancel.is_set():
+                cancelled = True
+                break
+            finished(chunk, evaluate_chunk(*args, *chunk, samples))
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+        try:
+            pending = {pool.submit(evaluate_chunk, *args, *chunk, samples): chunk for chunk in chunks}
+            while pending:
+                finished_futures, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in finished_futures:
+                    finished(pending.pop(future), future.result())
+                if pending and cancel is not None and cancel.is_set():
+                    cancelled = True
+                    break
+        finally:
+            # drop the queued chunks; a chunk already running in a worker
+            # can't be interrupted, so a cancelled sweep doesn't wait for it
+            pool.shutdown(wait=not cancelled, cancel_futures=True)
+
+    evaluated = sorted(results)
+    index = np.concatenate([np.arange(*chunk) for chunk in evaluated]) if evaluated else np.arange(0)
+
+    sweep = {
+        key: np.concatenate([results[chunk][key] for chunk in evaluated]) if evaluated else np.empty(0)
+        for key in ("ride_height_position", "rebound_travel", "heave_travel", "supported")
+    }
+    sweep["params"] = {
+        name: values[i]
+        for name, values, i in zip(names, axes, np.unravel_index(index, [len(values) for values in axes]))
+    }
+    sweep["ride_height_error"] = np.abs(sweep["ride_height_position"] - target_ride_height)
+
+    # lower is better for every objective: on target, then most bump and droop travel
+    supported = np.flatnonzero(sweep["supported"].astype(bool))
+    costs = np.column_stack((
+        sweep["ride_height_error"][supported],
+        -sweep["heave_travel"][supported],
+        -sweep["rebound_travel"][supported],
+    ))
+    sweep["pareto"] = supported[pareto_front(costs)] if supported.size else supported
+    sweep["total"] = total
+    sweep["cancelled"] = cancelled
+    return sweep
@@ -0,0 +1,26 @@
+import os
+import shutil
+
+import batch_runner
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_bad_project_files_become_error_rows(tmp_path):
+    bad = {
+        "null_rate.sus": '{"inputs": {"spring_rate": null}}',
+        "list.sus": "[1, 2]",
+        "inputs_list.sus": '{"inputs": [1]}',
+        "not_json.sus": "{",
+    }
+    for name, text in bad.items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+    shutil.copy(os.path.join(ROOT, "my_car.sus"), tmp_path / "my_car.sus")
+
+    out = tmp_path / "summary.csv"
+    assert batch_runner.main([str(tmp_path), "-o", str(out), "-j", "2"]) == 1
+
+    rows = batch_runner.run_batch(batch_runner.find_projects([str(tmp_path)]), workers=1)
+    errors = {os.path.basename(row["file"]) for row in rows if row.get("error")}
+    assert errors == set(bad)
+    assert sum(os.path.basename(row["file"]) == "my_car.sus" for row in rows) == 4
+    assert out.read_text(encoding="utf-8").startswith("file,corner,")
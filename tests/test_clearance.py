@@ -0,0 +1,20 @@
+import os
+
+import numpy as np
+
+import clearance
+from coilover_model import CoiloverModel
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_default_design_has_no_interference():
+    for model in (CoiloverModel(), CoiloverModel.from_file(os.path.join(ROOT, "my_car.sus"))):
+        result = clearance.compute_clearances(model)
+        assert clearance.first_interference(result) is None
+        assert np.all(result.penetration <= clearance.CONTACT_TOLERANCE)
+
+def test_bump_stop_engages_at_its_height():
+    model = CoiloverModel({"bump_height": 70}, toggles={"use_bump": True})
+    pair, travel = clearance.first_interference(clearance.compute_clearances(model))
+    assert pair == ("damper_body", "bump_stop")
+    assert np.isclose(travel, model.damper_free_length - model.damper_body_length - model.bump_height, atol=1e-3)
@@ -0,0 +1,65 @@
+import numpy as np
+
+from physics_utils import _helix_frames, _projected_frames, compute_frames, compute_tangents
+
+def helix(n_points=200, coils=6.5, radius=36.55, length=92.0):
+    theta = np.linspace(0, 2 * np.pi * coils, n_points)
+    return np.column_stack([radius * np.cos(theta), radius * np.sin(theta), np.linspace(0, length, n_points)])
+
+def rotated_frames(path_pts, tangents):
+    """
+    Reference parallel transport: rotate each normal by the rotation taking
+    the previous tangent onto the next one.
+    """
+    normals = np.zeros_like(path_pts)
+    normals[0] = np.cross(tangents[0], [0, 0, 1.0])
+    normals[0] /= np.linalg.norm(normals[0])
+    for i in range(1, len(path_pts)):
+        t0, t1, n = tangents[i - 1], tangents[i], normals[i - 1]
+        axis = np.cross(t0, t1)
+        s, c = np.linalg.norm(axis), np.dot(t0, t1)
+        if s < 1e-15:
+            normals[i] = n
+            continue
+        axis /= s
+        normals[i] = n * c + np.cross(axis, n) * s + axis * np.dot(axis, n) * (1 - c)
+    return normals
+
+def roll(tangents, a, b):
+    """
+    Angle about the tangent from normals a to normals b.
+    """
+    return np.arctan2(np.einsum("ij,ij->i", np.cross(a, b), tangents), np.einsum("ij,ij->i", a, b))
+
+def test_helix_frames_match_parallel_transport():
+    for n_points in (50, 200, 2000):
+        path = helix(n_points)
+        tangents, normals, binorms = compute_frames(path)
+        assert np.allclose(normals, rotated_frames(path, tangents), atol=1e-9)
+        assert np.allclose(binorms, np.cross(tangents, normals))
+
+def test_helix_frames_match_projection_loop_up_to_roll():
+    # the projection loop keeps the same normal planes but drifts by a roll
+    # about the tangent that shrinks as the path is refined; a round tube's
+    # surface doesn't depend on it
+    drift = []
+    for n_points in (200, 2000, 20000):
+        path = helix(n_points)
+        tangents, normals, _ = compute_frames(path)
+        loop_normals, _ = _projected_frames(path, tangents)
+        assert np.allclose(np.einsum("ij,ij->i", normals, tangents), 0, atol=1e-12)
+        assert np.allclose(np.linalg.norm(normals, axis=1), 1)
+        drift.append(np.max(np.abs(roll(tangents, loop_normals, normals))))
+    assert drift[0] > drift[1] > drift[2] and drift[2] < 0.01
+
+def test_other_paths_fall_back_to_the_loop():
+    rng = np.random.default_rng(1)
+    perturbed = helix(200) + rng.normal(scale=0.01, size=(200, 3))
+    cone = helix(200) * np.linspace(1, 2, 200)[:, None] * [1, 1, 0] + helix(200) * [0, 0, 1]
+    line = np.column_stack([np.linspace(0, 1, 50), np.zeros(50), np.linspace(0, 3, 50)])
+    for path in (perturbed, cone, line):
+        tangents = compute_tangents(path)
+        assert _helix_frames(path, tangents) is None
+        _, normals, binorms = compute_frames(path)
+        loop_normals, loop_binorms = _projected_frames(path, tangents)
+        assert np.array_equal(normals, loop_normals) and np.array_equal(binorms, loop_binorms)
@@ -0,0 +1,53 @@
+import threading
+import time
+
+import numpy as np
+
+import spring_sweep
+from coilover_model import CoiloverModel
+
+RANGES = {"spring_rate": np.linspace(50, 120, 15), "lower_perch_position": np.arange(0, 40, 2.5)}
+
+def brute_force_front(costs):
+    front = []
+    for i, row in enumerate(costs):
+        dominated = np.any(np.all(costs <= row, axis=1) & np.any(costs < row, axis=1))
+        duplicate = any(np.array_equal(costs[j], row) for j in front)
+        if not dominated and not duplicate:
+            front.append(i)
+    return np.array(front, dtype=int)
+
+def test_pareto_front_matches_brute_force():
+    rng = np.random.default_rng(3)
+    for n, m in ((1, 2), (50, 2), (200, 3), (300, 3)):
+        costs = rng.integers(0, 6, size=(n, m)).astype(float)  # plenty of ties
+        assert np.array_equal(spring_sweep.pareto_front(costs), brute_force_front(costs))
+
+def test_ride_height_travel_matches_model():
+    model = CoiloverModel()
+    travel_vals, force_vals = model.compute_force_curve()
+    target = np.array([force_vals[0] - 1, 1500.0, 2500.0, force_vals[-1] + 1])
+    ride = spring_sweep.ride_height_travel(np.tile(travel_vals, (4, 1)), np.tile(force_vals, (4, 1)), target)
+    expected = [travel_vals[0], np.interp(1500, force_vals, travel_vals), np.interp(2500, force_vals, travel_vals), travel_vals[-1]]
+    assert np.allclose(ride, expected)
+
+def test_parallel_sweep_matches_serial():
+    model = CoiloverModel()
+    serial = spring_sweep.run_sweep(model, RANGES, target_ride_height=100, chunk_size=32, workers=1)
+    parallel = spring_sweep.run_sweep(model, RANGES, target_ride_height=100, chunk_size=32, workers=2)
+    assert serial["total"] == parallel["total"] == 240
+    for key in ("ride_height_position", "heave_travel", "supported", "pareto"):
+        assert np.array_equal(serial[key], parallel[key])
+    for name in RANGES:
+        assert np.array_equal(serial["params"][name], parallel["params"][name])
+
+def test_cancelled_sweep_returns_early():
+    cancel = threading.Event()
+    def progress(done, total):
+        cancel.set()
+
+    start = time.perf_counter()
+    sweep = spring_sweep.run_sweep(CoiloverModel(), RANGES, target_ride_height=100, chunk_size=8,
+                                   workers=2, progress=progress, cancel=cancel)
+    assert sweep["cancelled"] and 0 < len(sweep["ride_height_position"]) < sweep["total"]
+    assert time.perf_counter() - start < 30
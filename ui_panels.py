@@ -17,11 +17,16 @@ def create_spring_group(
         q_spring_wire_diameter,
         q_spring_free_length,
         q_spring_rate,
-        q_spring_bind_length
+        q_spring_bind_length,
+        q_spring_catalog
         ):
     spring_group   = QtWidgets.QGroupBox("Spring")
     spring_layout  = QtWidgets.QFormLayout()
 
+    lbl = QtWidgets.QLabel("Catalog:")
+    lbl.setObjectName("Catalog")
+    spring_layout.addRow(lbl, q_spring_catalog)
+
     lbl = QtWidgets.QLabel("Inner diameter (mm):")
     lbl.setObjectName("Inner diameter")
     spring_layout.addRow(lbl, q_spring_id)
@@ -303,6 +308,34 @@ def create_setup_group(
     setup_group.setLayout(setup_layout)
     return setup_group, flip_damper_chk
 
+# Rows of the all-corners ride height table: (key in the ride height results, label)
+CORNER_SUMMARY_ROWS = (
+    ("ride_height_position", "Ride height travel (mm)"),
+    ("force", "Spring force (N)"),
+    ("rebound_travel", "Max rebound (mm)"),
+    ("heave_travel", "Max heave (mm)"),
+)
+
+def create_corner_summary_group():
+    group = QtWidgets.QGroupBox("Ride Height")
+    layout = QtWidgets.QVBoxLayout()
+    table = QtWidgets.QTableWidget(len(CORNER_SUMMARY_ROWS), 4)
+    table.setHorizontalHeaderLabels(["FL", "FR", "RL", "RR"])
+    table.setVerticalHeaderLabels([label for _, label in CORNER_SUMMARY_ROWS])
+    table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+    table.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+    table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+    table.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+    for row in range(table.rowCount()):
+        for col in range(table.columnCount()):
+            item = QtWidgets.QTableWidgetItem("")
+            item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+            table.setItem(row, col, item)
+    table.setFixedHeight(table.horizontalHeader().sizeHint().height() + table.verticalHeader().length() + 2 * table.frameWidth())
+    layout.addWidget(table)
+    group.setLayout(layout)
+    return group, table
+
 def create_vehicle_tab(corner_weights, unsprung_weights, motion_ratios):
     vehicle_tab = QtWidgets.QWidget()
     layout = QtWidgets.QVBoxLayout()
@@ -365,11 +398,14 @@ def create_vehicle_tab(corner_weights, unsprung_weights, motion_ratios):
         corner_select_layout.addWidget(btn)
     corner_select_group.setLayout(corner_select_layout)
 
+    summary_group, corner_table = create_corner_summary_group()
+
     layout.addWidget(corner_group)
     layout.addWidget(unsprung_group)
     layout.addWidget(motion_ratio_group)
     layout.addWidget(corner_select_group)
+    layout.addWidget(summary_group)
     layout.addStretch(1)
     vehicle_tab.setLayout(layout)
 
-    return vehicle_tab, corner_button_group
+    return vehicle_tab, corner_button_group, corner_table